@@ -8,19 +8,27 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import requests
 import json
-from datetime import datetime, date
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date
+from requests.adapters import HTTPAdapter
 from wekan_board_manager import WekanAuthManager, WekanAPIClient
 
+# Shared keep-alive session so batch operations reuse pooled connections
+# instead of opening a new TCP connection per request
+SESSION = requests.Session()
+SESSION.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=32))
+SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=32))
+SESSION.headers.update({'Connection': 'keep-alive'})
+
 def list_boards(api_client):
     """List all boards with creation dates"""
     boards = api_client._make_request('GET', '/boards')
     board_list = []
     for board in boards:
         created_at = board.get('createdAt')
-        if created_at:
-            created_date = datetime.fromisoformat(created_at.replace('Z', '+00:00')).date()
-        else:
-            created_date = None
+        # Timestamps have a fixed YYYY-MM-DDT...Z shape, so slicing the
+        # date prefix skips building the full datetime just to drop it
+        created_date = date.fromisoformat(created_at[:10]) if created_at else None
         board_list.append({
             'id': board['_id'],
             'title': board['title'],
@@ -39,7 +47,7 @@ if __name__ == "__main__":
     password = config['credentials']['password']
 
     auth_manager = WekanAuthManager(wekan_url, username, password)
-    api_client = WekanAPIClient(wekan_url, auth_manager)
+    api_client = WekanAPIClient(wekan_url, auth_manager, session=SESSION)
 
     boards = list_boards(api_client)
     today = date.today()
@@ -49,7 +57,22 @@ if __name__ == "__main__":
     for board in test_boards:
         print(f"ID: {board['id']}, Title: {board['title']}, Created: {board['created_at']}")
 
-    # For deletion, uncomment and confirm
-    for board in test_boards:
-        delete_board(api_client, board['id'])
-        print(f"Deleted board: {board['title']}")
+    # Delete in parallel: the work is I/O-bound, so a small thread pool
+    # over the shared keep-alive session pipelines the DELETE round-trips
+    results = []
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = {
+            executor.submit(delete_board, api_client, board['id']): board
+            for board in test_boards
+        }
+        for future in as_completed(futures):
+            board = futures[future]
+            try:
+                future.result()
+                results.append(f"Deleted board: {board['title']}")
+            except Exception as e:
+                results.append(f"Failed to delete board {board['title']}: {e}")
+
+    # One buffered write instead of a print (and stdout lock) per board
+    if results:
+        sys.stdout.write('\n'.join(results) + '\n')
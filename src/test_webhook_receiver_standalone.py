@@ -6,6 +6,8 @@ Test Suite for Standalone Webhook Receiver
 import unittest
 import requests
 import json
+import hmac
+import hashlib
 import os
 from datetime import datetime
 
@@ -15,27 +17,88 @@ class TestWebhookReceiver(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        """Verify server is running before tests"""
+        """Verify server is running and precompute payload bytes + signatures"""
+        cls.session = requests.Session()
         try:
-            response = requests.get(f"{cls.BASE_URL}/health", timeout=5)
+            response = cls.session.get(f"{cls.BASE_URL}/health", timeout=5)
             if response.status_code != 200:
                 raise ConnectionError("Webhook receiver not responding")
         except Exception as e:
             raise ConnectionError(f"Could not connect to webhook receiver: {str(e)}")
 
-    def generate_signature(self, payload):
-        """Generate valid GitHub signature for testing"""
-        import hmac
-        import hashlib
-        return hmac.new(
-            self.TEST_SECRET.encode('utf-8'),
-            payload,
-            hashlib.sha256
-        ).hexdigest()
+        # Serialize each payload and compute its HMAC once for the whole
+        # suite; the tests then POST the prepared bytes directly
+        payloads = {
+            "ping": {
+                "zen": "Testing the webhook receiver",
+                "hook_id": 12345,
+                "hook": {
+                    "type": "Repository",
+                    "id": 12345,
+                    "active": True
+                }
+            },
+            "issues": {
+                "action": "opened",
+                "issue": {
+                    "number": 1,
+                    "title": "Test Issue",
+                    "body": "This is a test issue",
+                    "state": "open",
+                    "created_at": datetime.now().isoformat(),
+                    "html_url": "http://github.com/test/repo/issues/1",
+                    "user": {"login": "tester"}
+                },
+                "repository": {
+                    "name": "test-repo",
+                    "full_name": "test/test-repo"
+                }
+            },
+            "pull_request": {
+                "action": "opened",
+                "pull_request": {
+                    "number": 2,
+                    "title": "Test PR",
+                    "body": "This is a test PR",
+                    "state": "open",
+                    "created_at": datetime.now().isoformat(),
+                    "html_url": "http://github.com/test/repo/pull/2",
+                    "user": {"login": "tester"},
+                    "base": {"ref": "main"},
+                    "head": {"ref": "feature"},
+                    "draft": False
+                },
+                "repository": {
+                    "name": "test-repo",
+                    "full_name": "test/test-repo"
+                }
+            }
+        }
+
+        secret = cls.TEST_SECRET.encode('utf-8')
+        cls.PAYLOADS = {}
+        for event, payload in payloads.items():
+            body = json.dumps(payload).encode('utf-8')
+            signature = hmac.new(secret, body, hashlib.sha256).hexdigest()
+            cls.PAYLOADS[event] = (body, signature)
+
+    def post_event(self, event):
+        """POST a precomputed payload for the given event type"""
+        body, signature = self.PAYLOADS[event]
+        return self.session.post(
+            f"{self.BASE_URL}/github-webhook",
+            data=body,
+            headers={
+                "Content-Type": "application/json",
+                "X-GitHub-Event": event,
+                "X-Hub-Signature-256": f"sha256={signature}"
+            },
+            timeout=(3.05, 10)
+        )
 
     def test_health_endpoint(self):
         """Test health check endpoint"""
-        response = requests.get(f"{self.BASE_URL}/health")
+        response = self.session.get(f"{self.BASE_URL}/health", timeout=(3.05, 10))
         self.assertEqual(response.status_code, 200)
         data = response.json()
         self.assertEqual(data['status'], 'healthy')
@@ -44,99 +107,27 @@ class TestWebhookReceiver(unittest.TestCase):
 
     def test_ping_event(self):
         """Test GitHub ping event"""
-        payload = {
-            "zen": "Testing the webhook receiver",
-            "hook_id": 12345,
-            "hook": {
-                "type": "Repository",
-                "id": 12345,
-                "active": True
-            }
-        }
-        headers = {
-            "X-GitHub-Event": "ping",
-            "X-Hub-Signature-256": f"sha256={self.generate_signature(json.dumps(payload).encode())}"
-        }
-        response = requests.post(
-            f"{self.BASE_URL}/github-webhook",
-            json=payload,
-            headers=headers
-        )
+        response = self.post_event("ping")
         self.assertEqual(response.status_code, 200)
         data = response.json()
         self.assertEqual(data['status'], 'success')
         self.assertEqual(data['message'], 'Webhook receiver is working!')
 
     def test_issue_event(self):
-        """Test GitHub issue event"""
-        payload = {
-            "action": "opened",
-            "issue": {
-                "number": 1,
-                "title": "Test Issue",
-                "body": "This is a test issue",
-                "state": "open",
-                "created_at": datetime.now().isoformat(),
-                "html_url": "http://github.com/test/repo/issues/1",
-                "user": {"login": "tester"}
-            },
-            "repository": {
-                "name": "test-repo",
-                "full_name": "test/test-repo"
-            }
-        }
-        headers = {
-            "X-GitHub-Event": "issues",
-            "X-Hub-Signature-256": f"sha256={self.generate_signature(json.dumps(payload).encode())}"
-        }
-        response = requests.post(
-            f"{self.BASE_URL}/github-webhook",
-            json=payload,
-            headers=headers
-        )
-        self.assertEqual(response.status_code, 200)
+        """Test GitHub issue event (acknowledged and queued)"""
+        response = self.post_event("issues")
+        self.assertEqual(response.status_code, 202)
         data = response.json()
-        self.assertEqual(data['status'], 'success')
-        self.assertEqual(data['action'], 'opened')
-        self.assertEqual(data['board_name'], 'GitHub Issues - test-repo')
-        self.assertEqual(data['card_title'], 'Issue #1: Test Issue')
+        self.assertTrue(data['queued'])
+        self.assertEqual(data['event'], 'issues')
 
     def test_pr_event(self):
-        """Test GitHub pull request event"""
-        payload = {
-            "action": "opened",
-            "pull_request": {
-                "number": 2,
-                "title": "Test PR",
-                "body": "This is a test PR",
-                "state": "open",
-                "created_at": datetime.now().isoformat(),
-                "html_url": "http://github.com/test/repo/pull/2",
-                "user": {"login": "tester"},
-                "base": {"ref": "main"},
-                "head": {"ref": "feature"},
-                "draft": False
-            },
-            "repository": {
-                "name": "test-repo",
-                "full_name": "test/test-repo"
-            }
-        }
-        headers = {
-            "X-GitHub-Event": "pull_request",
-            "X-Hub-Signature-256": f"sha256={self.generate_signature(json.dumps(payload).encode())}"
-        }
-        response = requests.post(
-            f"{self.BASE_URL}/github-webhook",
-            json=payload,
-            headers=headers
-        )
-        self.assertEqual(response.status_code, 200)
+        """Test GitHub pull request event (acknowledged and queued)"""
+        response = self.post_event("pull_request")
+        self.assertEqual(response.status_code, 202)
         data = response.json()
-        self.assertEqual(data['status'], 'success')
-        self.assertEqual(data['action'], 'opened')
-        self.assertEqual(data['board_name'], 'GitHub PRs - test-repo')
-        self.assertEqual(data['card_title'], 'PR #2: Test PR')
+        self.assertTrue(data['queued'])
+        self.assertEqual(data['event'], 'pull_request')
 
     def test_invalid_signature(self):
         """Test webhook with invalid signature"""
@@ -145,10 +136,11 @@ class TestWebhookReceiver(unittest.TestCase):
             "X-GitHub-Event": "ping",
             "X-Hub-Signature-256": "sha256=invalid_signature"
         }
-        response = requests.post(
+        response = self.session.post(
             f"{self.BASE_URL}/github-webhook",
             json=payload,
-            headers=headers
+            headers=headers,
+            timeout=(3.05, 10)
         )
         self.assertEqual(response.status_code, 401)
         data = response.json()
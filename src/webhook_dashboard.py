@@ -7,6 +7,8 @@ import tkinter as tk
 from tkinter import ttk, scrolledtext
 import requests
 import threading
+from collections import deque
+from requests.adapters import HTTPAdapter
 from datetime import datetime
 
 class WebhookDashboard:
@@ -68,31 +70,69 @@ class WebhookDashboard:
         
         # Initialize
         self.server_url = "http://localhost:5000"
+        self._session = requests.Session()
+        self._session.mount('http://', HTTPAdapter(pool_connections=1, pool_maxsize=2))
         self.running = False
         self.request_count = 0
-        self.refresh_status()
+
+        # Log entries are buffered and flushed on a timer so Tk coalesces
+        # redraws instead of forcing a full update per line
+        self._log_buffer = deque(maxlen=5000)
+        self._flush_pending = False
+        self.max_log_lines = 5000
+
+        self._schedule_poll()
 
     def log_message(self, message):
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.log_text.insert(tk.END, f"[{timestamp}] {message}\n")
+        self._log_buffer.append(f"[{timestamp}] {message}\n")
+        self._schedule_flush()
+
+    def _schedule_flush(self):
+        if not self._flush_pending:
+            self._flush_pending = True
+            self.root.after(100, self._flush_log)
+
+    def _flush_log(self):
+        self._flush_pending = False
+        if not self._log_buffer:
+            return
+        self.log_text.insert(tk.END, ''.join(self._log_buffer))
+        self._log_buffer.clear()
+        # Trim old lines so the widget doesn't grow without bound
+        line_count = int(self.log_text.index('end-1c').split('.')[0])
+        if line_count > self.max_log_lines:
+            self.log_text.delete('1.0', f'{line_count - self.max_log_lines}.0')
         self.log_text.see(tk.END)
-        self.log_text.update()
 
     def refresh_status(self):
+        # Poll off the Tk main thread so a dead server can't stall the UI
+        threading.Thread(target=self._poll_health, daemon=True).start()
+
+    def _schedule_poll(self):
+        self.refresh_status()
+        self.root.after(2000, self._schedule_poll)
+
+    def _poll_health(self):
         try:
-            response = requests.get(f"{self.server_url}/health", timeout=2)
+            response = self._session.get(
+                f"{self.server_url}/health", timeout=(0.5, 1.0)
+            )
             if response.status_code == 200:
                 data = response.json()
-                self.status_labels['server'].config(
-                    text=f"Server: Running ({data['mode']} mode)"
-                )
-                self.running = True
-                self.start_btn.config(state=tk.DISABLED)
-                self.stop_btn.config(state=tk.NORMAL)
-            else:
-                self.set_server_stopped()
+                self.root.after(0, self._set_server_running, data)
+                return
         except requests.exceptions.RequestException:
-            self.set_server_stopped()
+            pass
+        self.root.after(0, self.set_server_stopped)
+
+    def _set_server_running(self, data):
+        self.status_labels['server'].config(
+            text=f"Server: Running ({data['mode']} mode)"
+        )
+        self.running = True
+        self.start_btn.config(state=tk.DISABLED)
+        self.stop_btn.config(state=tk.NORMAL)
 
     def set_server_stopped(self):
         self.status_labels['server'].config(text="Server: Stopped")
@@ -4,20 +4,28 @@ GitHub Webhook Receiver for WeKan Integration
 Implements bidirectional synchronization between GitHub and WeKan
 """
 
+import io
 import os
 import sys
-import json
 import hmac
 import hashlib
 import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import orjson
+from cachetools import TTLCache
 from flask import Flask, request, jsonify
+from flask.json.provider import JSONProvider
 from datetime import datetime
 from typing import Dict, Optional, Any
 
 # Add parent directory to path to import wekan_board_manager
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from wekan_board_manager import WekanAuthManager, WekanAPIClient, BoardCreator, BoardTemplateManager
+# requests, ijson and wekan_board_manager are imported lazily (see
+# initialize_wekan and parse_push_payload) so forked gunicorn workers
+# don't pay for them until they are actually needed
 
 # Configure logging
 logging.basicConfig(
@@ -26,10 +34,24 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+class ORJSONProvider(JSONProvider):
+    """Flask JSON provider backed by orjson for faster ingress/egress"""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj).decode('utf-8')
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 
 # Configuration
 WEBHOOK_SECRET = os.getenv('GITHUB_WEBHOOK_SECRET', 'your_github_webhook_secret')
+WEBHOOK_SECRET_BYTES = WEBHOOK_SECRET.encode('utf-8')
+# HMAC prototype with the key schedule already expanded; verify_signature
+# copies it per request instead of re-deriving the inner/outer pads
+_HMAC_PROTO = hmac.new(WEBHOOK_SECRET_BYTES, digestmod=hashlib.sha256)
 WEKAN_URL = os.getenv('WEKAN_URL', 'http://localhost:8088')
 WEKAN_USERNAME = os.getenv('WEKAN_USERNAME', 'admin')
 WEKAN_PASSWORD = os.getenv('WEKAN_PASSWORD', 'admin123')
@@ -39,51 +61,235 @@ wekan_auth = None
 wekan_api = None
 board_creator = None
 
+# Background processing: webhooks are acknowledged immediately and the
+# WeKan API calls are drained by worker threads, so GitHub's delivery
+# window is not consumed by WeKan latency
+WORK_QUEUE = queue.Queue(maxsize=10_000)
+WORKER_COUNT = int(os.getenv('WEBHOOK_WORKERS', '4'))
+# PID that started the worker threads: threads don't survive a fork, so
+# a child that inherits this module state must start its own set
+_workers_started_pid = None
+
+# Idempotency cache: GitHub retries deliveries (up to dozens of times over
+# several hours), and each retry carries the same X-GitHub-Delivery ID.
+# Remembering seen IDs for a day keeps retries from creating duplicate
+# boards and cards.
+SEEN_DELIVERIES = TTLCache(maxsize=50_000, ttl=86_400)
+SEEN_DELIVERIES_LOCK = threading.Lock()
+
+# Boards-by-name cache: events repeatedly target the same boards
+# ("GitHub Issues - <repo>", ...), so resolve each name against WeKan
+# only once per TTL window instead of creating a board per event. The
+# TTL lets renames/deletions made in WeKan eventually be picked up.
+BOARD_CACHE = TTLCache(maxsize=1024, ttl=int(os.getenv('WEKAN_CACHE_TTL', '3600')))
+BOARD_CACHE_LOCK = threading.Lock()
+
+# Push events only ever produce cards for the most recent commits
+MAX_PUSH_COMMITS = 5
+
+# Card description templates, defined once at import so handlers only
+# fill in the variable fields instead of rebuilding the literals per event
+ISSUE_CARD_DESC = """
+**GitHub Issue**: {html_url}
+**Author**: {login}
+**State**: {state}
+**Created**: {created_at}
+
+**Description**:
+{body}
+
+**Labels**: {labels}
+"""
+
+PR_CARD_DESC = """
+**GitHub Pull Request**: {html_url}
+**Author**: {login}
+**State**: {state}
+**Base Branch**: {base_ref}
+**Head Branch**: {head_ref}
+**Created**: {created_at}
+
+**Description**:
+{body}
+
+**Mergeable**: {mergeable}
+**Draft**: {draft}
+"""
+
+COMMIT_CARD_DESC = """
+**GitHub Commit**: {url}
+**Author**: {author_name} <{author_email}>
+**Timestamp**: {timestamp}
+**SHA**: {sha}
+
+**Full Message**:
+{message}
+
+**Modified Files**: {modified}
+**Added Files**: {added}
+**Removed Files**: {removed}
+"""
+
+REPO_CARD_DESC = """
+**Repository**: {html_url}
+**Description**: {description}
+**Language**: {language}
+**Private**: {private}
+**Created**: {created_at}
+
+Initial setup tasks for the new repository.
+"""
+
 def initialize_wekan():
     """Initialize WeKan API components"""
     global wekan_auth, wekan_api, board_creator
-    
+
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    from wekan_board_manager import (
+        WekanAuthManager, WekanAPIClient, BoardCreator, BoardTemplateManager
+    )
+
     try:
+        # One pooled session shared by all webhook workers: connections to
+        # WeKan are reused instead of each worker opening fresh sockets
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=64,
+            max_retries=Retry(total=3, backoff_factor=0.2)
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+
         wekan_auth = WekanAuthManager(WEKAN_URL, WEKAN_USERNAME, WEKAN_PASSWORD)
-        wekan_api = WekanAPIClient(WEKAN_URL, wekan_auth)
+        wekan_api = WekanAPIClient(WEKAN_URL, wekan_auth, session=session)
         template_manager = BoardTemplateManager()
         board_creator = BoardCreator(wekan_api, template_manager)
+        bootstrap_board_cache()
+        start_workers()
         logger.info("WeKan API components initialized successfully")
         return True
     except Exception as e:
         logger.error(f"Failed to initialize WeKan API: {str(e)}")
         return False
 
+def start_workers():
+    """
+    Start the background worker threads that drain the webhook queue.
+
+    Keyed on the current PID rather than a boolean: if the module was
+    imported pre-fork (e.g. gunicorn --preload), the children inherit
+    the "started" state but not the threads themselves, so each worker
+    process must spawn its own set.
+    """
+    global _workers_started_pid
+    if _workers_started_pid == os.getpid():
+        return
+    _workers_started_pid = os.getpid()
+    for i in range(WORKER_COUNT):
+        threading.Thread(target=process_events, daemon=True,
+                         name=f'webhook-worker-{i}').start()
+    logger.info(f"Started {WORKER_COUNT} webhook worker threads")
+
+def process_events():
+    """Worker loop: pop queued webhook events and dispatch to handlers"""
+    # Bind the queue methods once so the loop body uses fast locals
+    get_event = WORK_QUEUE.get
+    task_done = WORK_QUEUE.task_done
+    while True:
+        event, payload, delivery_id = get_event()
+        try:
+            handler = DISPATCH.get(event)
+            if handler:
+                result = handler(payload)
+            else:
+                result = {'status': 'Event not handled', 'event': event}
+            logger.info(f"Processed delivery {delivery_id} ({event}): {result}")
+        except Exception as e:
+            logger.error(f"Error processing delivery {delivery_id} ({event}): {str(e)}")
+        finally:
+            task_done()
+
 def verify_signature(payload_body: bytes, signature: str) -> bool:
-    """Verify GitHub webhook signature"""
-    if not signature:
+    """Verify GitHub webhook signature (raw-bytes comparison)"""
+    if not signature or not signature.startswith('sha256='):
         return False
-    
+
     try:
-        hmac_digest = hmac.new(
-            WEBHOOK_SECRET.encode('utf-8'),
-            payload_body,
-            hashlib.sha256
-        ).hexdigest()
-        return hmac.compare_digest(f'sha256={hmac_digest}', signature)
+        # Copy the pre-keyed HMAC prototype and compare raw digests;
+        # decoding the header avoids hexdigest/f-string allocations
+        digest = _HMAC_PROTO.copy()
+        digest.update(payload_body)
+        expected = digest.digest()
+        received = bytes.fromhex(signature[7:])
+        return hmac.compare_digest(expected, received)
     except Exception as e:
         logger.error(f"Error verifying signature: {str(e)}")
         return False
 
+def bootstrap_board_cache():
+    """Populate the board cache from a single GET /boards at startup"""
+    try:
+        boards = wekan_api._make_request('GET', '/boards')
+        with BOARD_CACHE_LOCK:
+            for board in boards or []:
+                BOARD_CACHE[board['title']] = {
+                    '_id': board['_id'],
+                    'title': board['title'],
+                    'url': f"{WEKAN_URL}/b/{board['_id']}"
+                }
+        logger.info(f"Board cache bootstrapped with {len(BOARD_CACHE)} boards")
+    except Exception as e:
+        logger.warning(f"Could not bootstrap board cache: {str(e)}")
+
+def parse_push_payload(raw_body: bytes) -> Optional[Dict]:
+    """
+    Stream-parse a push payload, keeping only the fields handle_push_event
+    reads. A force-push can carry thousands of commits; ijson lets us stop
+    after MAX_PUSH_COMMITS instead of materializing the whole array.
+    """
+    import ijson
+
+    try:
+        buf = io.BytesIO(raw_body)
+        ref = next(ijson.items(buf, 'ref'), None)
+        buf.seek(0)
+        repo_name = next(ijson.items(buf, 'repository.name'), None)
+        buf.seek(0)
+        commits = []
+        for commit in ijson.items(buf, 'commits.item'):
+            commits.append(commit)
+            if len(commits) >= MAX_PUSH_COMMITS:
+                break
+        if ref is None or repo_name is None:
+            return None
+        return {'ref': ref, 'repository': {'name': repo_name}, 'commits': commits}
+    except Exception as e:
+        logger.error(f"Error stream-parsing push payload: {str(e)}")
+        return None
+
 def get_or_create_board(board_name: str) -> Optional[Dict]:
-    """Get existing board or create new one"""
+    """Get existing board (from cache) or create new one"""
+    with BOARD_CACHE_LOCK:
+        cached = BOARD_CACHE.get(board_name)
+    if cached:
+        return cached
+
     try:
-        # For now, we'll create boards using the template system
-        # In a full implementation, we'd first check if board exists
         result = board_creator.create_board_from_template(
             template_name='kanban_basic',
             board_title=board_name
         )
-        return {
+        board = {
             '_id': result['board_id'],
             'title': board_name,
             'url': result['board_url']
         }
+        with BOARD_CACHE_LOCK:
+            BOARD_CACHE[board_name] = board
+        return board
     except Exception as e:
         logger.error(f"Error creating board '{board_name}': {str(e)}")
         return None
@@ -118,215 +324,243 @@ def health_check():
 
 @app.route('/github-webhook', methods=['POST'])
 def handle_webhook():
-    """Main webhook handler"""
+    """Main webhook handler: verify, enqueue, acknowledge"""
     try:
+        # Read the body exactly once; the same bytes feed the signature
+        # check and the JSON parse
+        body = request.get_data(cache=True)
+
         # Verify signature
         signature = request.headers.get('X-Hub-Signature-256')
-        if not verify_signature(request.data, signature):
+        if not verify_signature(body, signature):
             logger.warning("Invalid webhook signature")
             return jsonify({'error': 'Invalid signature'}), 401
 
         event = request.headers.get('X-GitHub-Event')
-        payload = request.get_json()
+
+        # Push payloads can be huge; extract only the fields we use and
+        # cap the commits array instead of parsing the full document
+        if event == 'push':
+            payload = parse_push_payload(body)
+        else:
+            try:
+                payload = orjson.loads(body)
+            except orjson.JSONDecodeError:
+                payload = None
 
         if not payload:
             return jsonify({'error': 'Invalid JSON payload'}), 400
 
         logger.info(f"Received GitHub webhook event: {event}")
 
-        # Process different GitHub events
-        if event == 'issues':
-            return handle_issue_event(payload)
-        elif event == 'pull_request':
-            return handle_pull_request_event(payload)
-        elif event == 'push':
-            return handle_push_event(payload)
-        elif event == 'repository':
-            return handle_repository_event(payload)
-        else:
-            logger.info(f"Unhandled event type: {event}")
-            return jsonify({'status': 'Event not handled', 'event': event}), 200
+        # Skip deliveries we have already accepted (GitHub retries)
+        delivery_id = request.headers.get('X-GitHub-Delivery')
+        if delivery_id:
+            with SEEN_DELIVERIES_LOCK:
+                cached = SEEN_DELIVERIES.get(delivery_id)
+            if cached is not None:
+                logger.info(f"Duplicate delivery {delivery_id}; returning cached response")
+                return jsonify(cached), 200
+
+        # Acknowledge first, process later: the workers make the WeKan
+        # calls so the response only costs the HMAC check and JSON parse.
+        # start_workers is a no-op when this process already has its
+        # threads; it only spawns after a fork invalidated the inherited
+        # ones.
+        start_workers()
+        try:
+            WORK_QUEUE.put_nowait((event, payload, delivery_id))
+        except queue.Full:
+            # 503 makes GitHub retry the delivery instead of dropping it
+            logger.error("Webhook queue full; rejecting delivery")
+            return jsonify({'error': 'Queue full, retry later'}), 503
+
+        response_body = {'status': 'queued', 'event': event}
+        if delivery_id:
+            with SEEN_DELIVERIES_LOCK:
+                SEEN_DELIVERIES[delivery_id] = response_body
+        return jsonify(response_body), 202
 
     except Exception as e:
         logger.error(f"Error processing webhook: {str(e)}")
         return jsonify({'error': 'Internal server error'}), 500
 
-def handle_issue_event(payload: Dict) -> Any:
+def handle_issue_event(payload: Dict) -> Dict:
     """Handle GitHub issue events"""
     try:
         action = payload['action']
         issue = payload['issue']
         repository = payload['repository']
-        
+
         logger.info(f"Processing issue event: {action} for issue #{issue['number']}")
-        
+
         if action in ['opened', 'reopened', 'edited']:
             # Create board name based on repository
             board_name = f"GitHub Issues - {repository['name']}"
-            
+
             # Get or create the board
             board = get_or_create_board(board_name)
             if not board:
-                return jsonify({'error': 'Failed to create/get board'}), 500
+                return {'error': 'Failed to create/get board'}
             
             # Create card title and description
             card_title = f"Issue #{issue['number']}: {issue['title']}"
-            card_desc = f"""
-**GitHub Issue**: {issue['html_url']}
-**Author**: {issue['user']['login']}
-**State**: {issue['state']}
-**Created**: {issue['created_at']}
-
-**Description**:
-{issue['body'] or 'No description provided'}
-
-**Labels**: {', '.join([label['name'] for label in issue.get('labels', [])])}
-"""
+            card_desc = ISSUE_CARD_DESC.format(
+                html_url=issue['html_url'],
+                login=issue['user']['login'],
+                state=issue['state'],
+                created_at=issue['created_at'],
+                body=issue['body'] or 'No description provided',
+                labels=', '.join(label['name'] for label in issue.get('labels', ()))
+            )
             
             # Add card to the appropriate list
             list_name = 'To Do' if action == 'opened' else 'Backlog'
             card = add_card_to_board(board['_id'], list_name, card_title, card_desc)
-            
+
             if card:
-                return jsonify({
+                return {
                     'status': 'success',
                     'action': action,
                     'board_id': board['_id'],
                     'card_id': card['_id'],
                     'message': f"Issue #{issue['number']} synchronized to WeKan"
-                })
+                }
             else:
-                return jsonify({'error': 'Failed to create card'}), 500
-        
+                return {'error': 'Failed to create card'}
+
         elif action == 'closed':
             # In a full implementation, we'd move the card to 'Done'
             logger.info(f"Issue #{issue['number']} closed - would move card to Done list")
-            return jsonify({
+            return {
                 'status': 'success',
                 'action': action,
                 'message': f"Issue #{issue['number']} closed"
-            })
-        
-        return jsonify({'status': 'Issue event processed', 'action': action})
-        
+            }
+
+        return {'status': 'Issue event processed', 'action': action}
+
     except Exception as e:
         logger.error(f"Error handling issue event: {str(e)}")
-        return jsonify({'error': 'Failed to process issue event'}), 500
+        return {'error': 'Failed to process issue event'}
 
-def handle_pull_request_event(payload: Dict) -> Any:
+def handle_pull_request_event(payload: Dict) -> Dict:
     """Handle GitHub pull request events"""
     try:
         action = payload['action']
         pr = payload['pull_request']
         repository = payload['repository']
-        
+
         logger.info(f"Processing PR event: {action} for PR #{pr['number']}")
-        
+
         if action in ['opened', 'reopened', 'edited']:
             # Create board name based on repository
             board_name = f"GitHub PRs - {repository['name']}"
-            
+
             # Get or create the board
             board = get_or_create_board(board_name)
             if not board:
-                return jsonify({'error': 'Failed to create/get board'}), 500
+                return {'error': 'Failed to create/get board'}
             
             # Create card title and description
             card_title = f"PR #{pr['number']}: {pr['title']}"
-            card_desc = f"""
-**GitHub Pull Request**: {pr['html_url']}
-**Author**: {pr['user']['login']}
-**State**: {pr['state']}
-**Base Branch**: {pr['base']['ref']}
-**Head Branch**: {pr['head']['ref']}
-**Created**: {pr['created_at']}
-
-**Description**:
-{pr['body'] or 'No description provided'}
-
-**Mergeable**: {pr.get('mergeable', 'Unknown')}
-**Draft**: {pr.get('draft', False)}
-"""
+            card_desc = PR_CARD_DESC.format(
+                html_url=pr['html_url'],
+                login=pr['user']['login'],
+                state=pr['state'],
+                base_ref=pr['base']['ref'],
+                head_ref=pr['head']['ref'],
+                created_at=pr['created_at'],
+                body=pr['body'] or 'No description provided',
+                mergeable=pr.get('mergeable', 'Unknown'),
+                draft=pr.get('draft', False)
+            )
             
             # Add card to Review list
             card = add_card_to_board(board['_id'], 'To Do', card_title, card_desc)
-            
+
             if card:
-                return jsonify({
+                return {
                     'status': 'success',
                     'action': action,
                     'board_id': board['_id'],
                     'card_id': card['_id'],
                     'message': f"PR #{pr['number']} synchronized to WeKan"
-                })
+                }
             else:
-                return jsonify({'error': 'Failed to create card'}), 500
-        
-        return jsonify({'status': 'PR event processed', 'action': action})
-        
+                return {'error': 'Failed to create card'}
+
+        return {'status': 'PR event processed', 'action': action}
+
     except Exception as e:
         logger.error(f"Error handling PR event: {str(e)}")
-        return jsonify({'error': 'Failed to process PR event'}), 500
+        return {'error': 'Failed to process PR event'}
 
-def handle_push_event(payload: Dict) -> Any:
+def handle_push_event(payload: Dict) -> Dict:
     """Handle GitHub push events"""
     try:
         ref = payload['ref']
         commits = payload['commits']
         repository = payload['repository']
-        
+
         logger.info(f"Processing push event: {len(commits)} commits to {ref}")
-        
+
         # Only process pushes to main/master branch
         if ref in ['refs/heads/main', 'refs/heads/master']:
             board_name = f"GitHub Commits - {repository['name']}"
-            
+
             # Get or create the board
             board = get_or_create_board(board_name)
             if not board:
-                return jsonify({'error': 'Failed to create/get board'}), 500
+                return {'error': 'Failed to create/get board'}
             
-            cards_created = 0
-            for commit in commits[:5]:  # Limit to 5 most recent commits
-                commit_message = commit['message'].split('\n')[0]  # First line only
+            card_payloads = []
+            format_desc = COMMIT_CARD_DESC.format  # local bind for the loop
+            for commit in commits[:MAX_PUSH_COMMITS]:  # Limit to most recent commits
+                commit_message = commit['message'].partition('\n')[0]  # First line only
                 card_title = f"Commit: {commit_message}"
-                card_desc = f"""
-**GitHub Commit**: {commit['url']}
-**Author**: {commit['author']['name']} <{commit['author']['email']}>
-**Timestamp**: {commit['timestamp']}
-**SHA**: {commit['id'][:8]}
-
-**Full Message**:
-{commit['message']}
-
-**Modified Files**: {len(commit.get('modified', []))}
-**Added Files**: {len(commit.get('added', []))}
-**Removed Files**: {len(commit.get('removed', []))}
-"""
-                
-                card = add_card_to_board(board['_id'], 'Done', card_title, card_desc)
-                if card:
-                    cards_created += 1
-            
-            return jsonify({
+                card_desc = format_desc(
+                    url=commit['url'],
+                    author_name=commit['author']['name'],
+                    author_email=commit['author']['email'],
+                    timestamp=commit['timestamp'],
+                    sha=commit['id'][:8],
+                    message=commit['message'],
+                    modified=len(commit.get('modified', ())),
+                    added=len(commit.get('added', ())),
+                    removed=len(commit.get('removed', ()))
+                )
+                card_payloads.append((card_title, card_desc))
+
+            # Create the cards in parallel over the pooled session so the
+            # handler pays one round-trip instead of one per commit
+            board_id = board['_id']
+            with ThreadPoolExecutor(max_workers=MAX_PUSH_COMMITS) as executor:
+                results = list(executor.map(
+                    lambda p: add_card_to_board(board_id, 'Done', p[0], p[1]),
+                    card_payloads
+                ))
+            cards_created = sum(1 for card in results if card)
+
+            return {
                 'status': 'success',
                 'board_id': board['_id'],
                 'cards_created': cards_created,
                 'message': f"Processed {len(commits)} commits, created {cards_created} cards"
-            })
-        
-        return jsonify({'status': 'Push event processed', 'ref': ref})
-        
+            }
+
+        return {'status': 'Push event processed', 'ref': ref}
+
     except Exception as e:
         logger.error(f"Error handling push event: {str(e)}")
-        return jsonify({'error': 'Failed to process push event'}), 500
+        return {'error': 'Failed to process push event'}
 
-def handle_repository_event(payload: Dict) -> Any:
+def handle_repository_event(payload: Dict) -> Dict:
     """Handle GitHub repository events"""
     try:
         action = payload['action']
         repository = payload['repository']
-        
+
         logger.info(f"Processing repository event: {action} for {repository['name']}")
         
         if action == 'created':
@@ -337,32 +571,39 @@ def handle_repository_event(payload: Dict) -> Any:
             if board:
                 # Add initial setup card
                 setup_card = add_card_to_board(
-                    board['_id'], 
-                    'To Do', 
+                    board['_id'],
+                    'To Do',
                     'Repository Setup',
-                    f"""
-**Repository**: {repository['html_url']}
-**Description**: {repository.get('description', 'No description')}
-**Language**: {repository.get('language', 'Unknown')}
-**Private**: {repository['private']}
-**Created**: {repository['created_at']}
-
-Initial setup tasks for the new repository.
-"""
+                    REPO_CARD_DESC.format(
+                        html_url=repository['html_url'],
+                        description=repository.get('description', 'No description'),
+                        language=repository.get('language', 'Unknown'),
+                        private=repository['private'],
+                        created_at=repository['created_at']
+                    )
                 )
                 
-                return jsonify({
+                return {
                     'status': 'success',
                     'action': action,
                     'board_id': board['_id'],
                     'message': f"Created board for repository {repository['name']}"
-                })
-        
-        return jsonify({'status': 'Repository event processed', 'action': action})
-        
+                }
+
+        return {'status': 'Repository event processed', 'action': action}
+
     except Exception as e:
         logger.error(f"Error handling repository event: {str(e)}")
-        return jsonify({'error': 'Failed to process repository event'}), 500
+        return {'error': 'Failed to process repository event'}
+
+# Event dispatch table used by the worker loop; registering a new event
+# type only requires adding its handler here
+DISPATCH = {
+    'issues': handle_issue_event,
+    'pull_request': handle_pull_request_event,
+    'push': handle_push_event,
+    'repository': handle_repository_event,
+}
 
 @app.errorhandler(404)
 def not_found(error):
@@ -373,11 +614,13 @@ def internal_error(error):
     return jsonify({'error': 'Internal server error'}), 500
 
 if __name__ == '__main__':
+    # Local debugging only -- production deployments should use
+    # gunicorn with gevent workers via wsgi.py (see src/wsgi.py)
     # Initialize WeKan connection
     if not initialize_wekan():
         logger.error("Failed to initialize WeKan connection. Exiting.")
         sys.exit(1)
-    
+
     # Start the Flask application
     logger.info("Starting GitHub Webhook Receiver...")
     logger.info(f"WeKan URL: {WEKAN_URL}")
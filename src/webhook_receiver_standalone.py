@@ -2,16 +2,38 @@
 """
 GitHub Webhook Receiver for WeKan Integration (Standalone Version)
 This version works without WeKan connection for testing and debugging
+
+Served with FastAPI + uvicorn: async handlers let a single worker
+multiplex concurrent GitHub deliveries on the event loop instead of
+tying up one thread per request. Production runs size the worker pool
+to the host (2*cores+1) with uvloop and httptools:
+
+    uvicorn webhook_receiver_standalone:app --host 0.0.0.0 --port $PORT \
+        --workers $(( 2 * $(nproc) + 1 )) --loop uvloop --http httptools \
+        --log-level warning
+
+(omit --loop uvloop on Windows, where uvloop is unavailable)
+
+or set WEB_CONCURRENCY and run this module directly. Per-worker
+concurrency stays bounded by the fixed worker-task pool draining the
+delivery queue.
 """
 
+import io
 import os
 import sys
-import json
+import time
 import hmac
 import hashlib
 import logging
-from flask import Flask, request, jsonify
+import asyncio
+import orjson
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import ORJSONResponse
+from starlette.exceptions import HTTPException as StarletteHTTPException
 from datetime import datetime
+from itertools import islice
 from typing import Dict, Optional, Any
 
 # Configure logging
@@ -21,271 +43,442 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-app = Flask(__name__)
+app = FastAPI(title="GitHub Webhook Receiver (Standalone)",
+              default_response_class=ORJSONResponse)
 
 # Configuration
 WEBHOOK_SECRET = os.getenv('GITHUB_WEBHOOK_SECRET', 'test_secret_key_for_development')
+WEBHOOK_SECRET_BYTES = WEBHOOK_SECRET.encode('utf-8')
 PORT = int(os.getenv('PORT', 5000))
-DEBUG = os.getenv('DEBUG', 'true').lower() == 'true'
+# Debug is opt-in: defaulting it on meant any deploy that forgot to set
+# DEBUG=false ran with debug-level logging (and, under the old Flask dev
+# server, the reloader and interactive debugger)
+DEBUG = os.getenv('DEBUG', 'false').lower() == 'true'
 
-def verify_signature(payload_body: bytes, signature: str) -> bool:
-    """Verify GitHub webhook signature"""
+# Unsigned requests are rejected unless explicitly allowed for local
+# development; the old default silently accepted them
+ALLOW_UNSIGNED = os.getenv('ALLOW_UNSIGNED_WEBHOOKS', 'false').lower() == 'true'
+if ALLOW_UNSIGNED:
+    logger.warning("ALLOW_UNSIGNED_WEBHOOKS is enabled: unsigned webhook "
+                   "requests will be accepted (development only)")
+
+# Background processing: deliveries are acknowledged with 202 as soon as
+# the signature checks out, and worker tasks drain the queue so response
+# time stays independent of downstream (WeKan) latency
+WORKER_COUNT = int(os.getenv('WEBHOOK_WORKERS', '4'))
+QUEUE: asyncio.Queue = asyncio.Queue(maxsize=10_000)
+
+# Cap on commits materialized from a push payload; the handler only
+# ever looks at the first few
+MAX_PUSH_COMMITS = 5
+
+def parse_push_payload(raw_body: bytes) -> Optional[Dict]:
+    """
+    Stream-parse a push payload, keeping only the fields
+    handle_push_event reads. A force-push can carry thousands of
+    commits; ijson lets us stop after MAX_PUSH_COMMITS instead of
+    materializing the whole array. The body is already buffered for
+    signature verification, so the parse runs over those bytes.
+    """
+    import ijson
+
+    try:
+        buf = io.BytesIO(raw_body)
+        ref = next(ijson.items(buf, 'ref'), None)
+        buf.seek(0)
+        repo_name = next(ijson.items(buf, 'repository.name'), None)
+        buf.seek(0)
+        commits = list(islice(ijson.items(buf, 'commits.item'), MAX_PUSH_COMMITS))
+        if ref is None or repo_name is None:
+            return None
+        return {'ref': ref, 'repository': {'name': repo_name}, 'commits': commits}
+    except Exception as e:
+        logger.error("Error stream-parsing push payload: %s", e)
+        return None
+
+@app.on_event('startup')
+async def start_workers():
+    for i in range(WORKER_COUNT):
+        asyncio.create_task(process_events(), name=f'webhook-worker-{i}')
+    logger.info("Started %d webhook worker tasks", WORKER_COUNT)
+
+async def process_events():
+    """Worker loop: pop queued webhook events and dispatch to handlers"""
+    while True:
+        event, payload = await QUEUE.get()
+        try:
+            handler = _HANDLERS.get(event)
+            if handler:
+                result = await handler(payload)
+            else:
+                result = ORJSONResponse({'status': 'Event not handled', 'event': event})
+            logger.info("Processed %s event (status %s)", event, result.status_code)
+        except WebhookError as e:
+            # Same serializer the in-request handler uses, so handler
+            # failures look identical whichever path raised them
+            result = _error_response(e)
+            logger.error("Error processing %s event (status %s): %s",
+                         e.event, result.status_code, e.__cause__ or e)
+        except Exception as e:
+            logger.error("Error processing %s event: %s", event, e)
+        finally:
+            QUEUE.task_done()
+
+def compare_signature(expected_digest: bytes, signature: str) -> bool:
+    """Compare a computed HMAC digest against the signature header"""
     if not signature:
         logger.warning("No signature provided")
-        return True  # Allow for testing without signature
-    
+        return ALLOW_UNSIGNED
+
+    # Reject malformed headers before doing any comparison work; the
+    # length of the signature is not secret, so early exit here is safe
+    scheme, _, sig_hex = signature.partition('=')
+    if scheme != 'sha256' or len(sig_hex) != 64:
+        return False
+
     try:
-        hmac_digest = hmac.new(
-            WEBHOOK_SECRET.encode('utf-8'),
-            payload_body,
-            hashlib.sha256
-        ).hexdigest()
-        return hmac.compare_digest(f'sha256={hmac_digest}', signature)
+        provided = bytes.fromhex(sig_hex)
+        return hmac.compare_digest(expected_digest, provided)
     except Exception as e:
-        logger.error(f"Error verifying signature: {str(e)}")
+        logger.error("Error verifying signature: %s", e)
         return False
 
-@app.route('/health', methods=['GET'])
-def health_check():
+def verify_signature(payload_body: bytes, signature: str) -> bool:
+    """Verify GitHub webhook signature against an already-buffered body"""
+    expected = hmac.new(
+        WEBHOOK_SECRET_BYTES,
+        payload_body,
+        hashlib.sha256
+    ).digest()
+    return compare_signature(expected, signature)
+
+class WebhookError(Exception):
+    """Handler failure routed to the shared error serializer"""
+
+    def __init__(self, event: str, status: int = 500):
+        super().__init__(event)
+        self.event = event
+        self.status = status
+
+def _error_response(exc: WebhookError) -> ORJSONResponse:
+    """One serializer for every handler failure instead of per-handler dicts.
+
+    Used directly by the worker loop (handlers run on queue tasks, not
+    inside a request, so FastAPI's exception handling never sees them)
+    and by the registered handler below for anything raised in-request.
+    """
+    return ORJSONResponse({'error': f'Failed to process {exc.event} event'},
+                          status_code=exc.status)
+
+@app.exception_handler(WebhookError)
+async def webhook_error_handler(request: Request, exc: WebhookError) -> ORJSONResponse:
+    return _error_response(exc)
+
+# Success responses share the same skeleton across handlers; copying a
+# prebuilt dict and updating the variable fields avoids rebuilding the
+# literal (and re-interning its keys) per event
+_SUCCESS_TEMPLATE = {'status': 'success', 'mode': 'standalone'}
+
+def _success_response(**fields: Any) -> ORJSONResponse:
+    """Build a success response from the shared skeleton"""
+    resp = _SUCCESS_TEMPLATE.copy()
+    resp.update(fields)
+    return ORJSONResponse(resp)
+
+# Load balancers probe /health every few seconds per instance; caching
+# the formatted timestamp at one-second resolution keeps the endpoint
+# free of per-request datetime formatting
+_health_ts = [0.0, '']
+
+@app.get('/health')
+async def health_check():
     """Health check endpoint"""
-    return jsonify({
+    now = time.time()
+    if now - _health_ts[0] >= 1.0:
+        _health_ts[0] = now
+        _health_ts[1] = datetime.now().isoformat()
+    return {
         'status': 'healthy',
-        'timestamp': datetime.now().isoformat(),
+        'timestamp': _health_ts[1],
         'wekan_connected': False,
         'mode': 'standalone'
-    })
+    }
 
-@app.route('/github-webhook', methods=['POST'])
-def handle_webhook():
+@app.post('/github-webhook')
+async def handle_webhook(request: Request):
     """Main webhook handler"""
     try:
+        # Stream the body through HMAC while buffering it, overlapping
+        # the digest with network receive instead of hashing a second
+        # copy of the fully buffered payload afterwards
+        digest = hmac.new(WEBHOOK_SECRET_BYTES, digestmod=hashlib.sha256)
+        buf = io.BytesIO()
+        async for chunk in request.stream():
+            digest.update(chunk)
+            buf.write(chunk)
+        body = buf.getvalue()
+
         # Verify signature (optional in standalone mode)
         signature = request.headers.get('X-Hub-Signature-256')
-        if not verify_signature(request.data, signature):
+        if not compare_signature(digest.digest(), signature):
             logger.warning("Invalid webhook signature")
-            return jsonify({'error': 'Invalid signature'}), 401
+            return ORJSONResponse({'error': 'Invalid signature'}, status_code=401)
 
         event = request.headers.get('X-GitHub-Event')
-        payload = request.get_json()
+        if event == 'push':
+            # Push payloads can be huge; pull only the fields the
+            # handler needs and the first MAX_PUSH_COMMITS commits
+            payload = parse_push_payload(body)
+        else:
+            try:
+                payload = orjson.loads(body)
+            except orjson.JSONDecodeError:
+                payload = None
 
         if not payload:
-            return jsonify({'error': 'Invalid JSON payload'}), 400
-
-        logger.info(f"Received GitHub webhook event: {event}")
-
-        # Process different GitHub events
-        if event == 'issues':
-            return handle_issue_event(payload)
-        elif event == 'pull_request':
-            return handle_pull_request_event(payload)
-        elif event == 'push':
-            return handle_push_event(payload)
-        elif event == 'repository':
-            return handle_repository_event(payload)
-        elif event == 'ping':
-            return handle_ping_event(payload)
-        else:
-            logger.info(f"Unhandled event type: {event}")
-            return jsonify({'status': 'Event not handled', 'event': event}), 200
+            return ORJSONResponse({'error': 'Invalid JSON payload'}, status_code=400)
+
+        logger.info("Received GitHub webhook event: %s", event)
+
+        # Ping does no downstream work, so answer it inline
+        if event == 'ping':
+            return await handle_ping_event(payload)
+
+        # Everything else is acknowledged immediately and drained by the
+        # worker tasks off the request path
+        try:
+            QUEUE.put_nowait((event, payload))
+        except asyncio.QueueFull:
+            # 503 makes GitHub retry the delivery instead of dropping it
+            logger.error("Webhook queue full; rejecting delivery")
+            return ORJSONResponse({'error': 'Queue full, retry later'}, status_code=503)
+
+        return ORJSONResponse({'queued': True, 'event': event}, status_code=202)
 
     except Exception as e:
-        logger.error(f"Error processing webhook: {str(e)}")
-        return jsonify({'error': 'Internal server error'}), 500
+        logger.error("Error processing webhook: %s", e)
+        return ORJSONResponse({'error': 'Internal server error'}, status_code=500)
 
-def handle_ping_event(payload: Dict) -> Any:
+async def handle_ping_event(payload: Dict) -> ORJSONResponse:
     """Handle GitHub ping events"""
     logger.info("Received ping event from GitHub")
-    return jsonify({
+    return ORJSONResponse({
         'status': 'success',
         'message': 'Webhook receiver is working!',
         'zen': payload.get('zen', 'No zen provided')
     })
 
-def handle_issue_event(payload: Dict) -> Any:
+async def handle_issue_event(payload: Dict) -> ORJSONResponse:
     """Handle GitHub issue events"""
     try:
         action = payload['action']
         issue = payload['issue']
         repository = payload['repository']
-        
-        logger.info(f"Processing issue event: {action} for issue #{issue['number']}")
-        
+
+        logger.info("Processing issue event: %s for issue #%s", action, issue['number'])
+
         if action in ['opened', 'reopened', 'edited']:
             # Simulate WeKan board creation
             board_name = f"GitHub Issues - {repository['name']}"
-            
-            # Create card title and description
+
+            # Create card title and description; building parts and
+            # joining once avoids re-copying the string for every field,
+            # and the generator skips an intermediate label list
             card_title = f"Issue #{issue['number']}: {issue['title']}"
-            card_desc = f"""
-**GitHub Issue**: {issue['html_url']}
-**Author**: {issue['user']['login']}
-**State**: {issue['state']}
-**Created**: {issue['created_at']}
+            parts = [
+                '',
+                "**GitHub Issue**: " + issue['html_url'],
+                "**Author**: " + issue['user']['login'],
+                "**State**: " + issue['state'],
+                "**Created**: " + issue['created_at'],
+                '',
+                '**Description**:',
+                issue['body'] or 'No description provided',
+                '',
+                "**Labels**: " + ', '.join(
+                    label['name'] for label in issue.get('labels', ())),
+                '',
+            ]
+            card_desc = '\n'.join(parts)
 
-**Description**:
-{issue['body'] or 'No description provided'}
+            logger.info("Would create WeKan card: %s", card_title)
+            logger.info("In board: %s", board_name)
+
+            return _success_response(
+                action=action,
+                board_name=board_name,
+                card_title=card_title,
+                message=f"Issue #{issue['number']} would be synchronized to WeKan"
+            )
 
-**Labels**: {', '.join([label['name'] for label in issue.get('labels', [])])}
-"""
-            
-            logger.info(f"Would create WeKan card: {card_title}")
-            logger.info(f"In board: {board_name}")
-            
-            return jsonify({
-                'status': 'success',
-                'action': action,
-                'board_name': board_name,
-                'card_title': card_title,
-                'message': f"Issue #{issue['number']} would be synchronized to WeKan",
-                'mode': 'standalone'
-            })
-        
         elif action == 'closed':
-            logger.info(f"Issue #{issue['number']} closed - would move card to Done list")
-            return jsonify({
-                'status': 'success',
-                'action': action,
-                'message': f"Issue #{issue['number']} closed",
-                'mode': 'standalone'
-            })
-        
-        return jsonify({'status': 'Issue event processed', 'action': action})
-        
+            logger.info("Issue #%s closed - would move card to Done list", issue['number'])
+            return _success_response(
+                action=action,
+                message=f"Issue #{issue['number']} closed"
+            )
+
+        return ORJSONResponse({'status': 'Issue event processed', 'action': action})
+
     except Exception as e:
-        logger.error(f"Error handling issue event: {str(e)}")
-        return jsonify({'error': 'Failed to process issue event'}), 500
+        logger.error("Error handling issue event: %s", e)
+        raise WebhookError('issue') from e
 
-def handle_pull_request_event(payload: Dict) -> Any:
+async def handle_pull_request_event(payload: Dict) -> ORJSONResponse:
     """Handle GitHub pull request events"""
     try:
         action = payload['action']
         pr = payload['pull_request']
         repository = payload['repository']
-        
-        logger.info(f"Processing PR event: {action} for PR #{pr['number']}")
-        
+
+        logger.info("Processing PR event: %s for PR #%s", action, pr['number'])
+
         if action in ['opened', 'reopened', 'edited']:
             # Simulate WeKan board creation
             board_name = f"GitHub PRs - {repository['name']}"
-            
-            # Create card title and description
+
+            # Create card title and description (same parts/join pattern
+            # as the issue handler)
             card_title = f"PR #{pr['number']}: {pr['title']}"
-            card_desc = f"""
-**GitHub Pull Request**: {pr['html_url']}
-**Author**: {pr['user']['login']}
-**State**: {pr['state']}
-**Base Branch**: {pr['base']['ref']}
-**Head Branch**: {pr['head']['ref']}
-**Created**: {pr['created_at']}
-
-**Description**:
-{pr['body'] or 'No description provided'}
-
-**Mergeable**: {pr.get('mergeable', 'Unknown')}
-**Draft**: {pr.get('draft', False)}
-"""
-            
-            logger.info(f"Would create WeKan card: {card_title}")
-            logger.info(f"In board: {board_name}")
-            
-            return jsonify({
-                'status': 'success',
-                'action': action,
-                'board_name': board_name,
-                'card_title': card_title,
-                'message': f"PR #{pr['number']} would be synchronized to WeKan",
-                'mode': 'standalone'
-            })
-        
-        return jsonify({'status': 'PR event processed', 'action': action})
-        
+            parts = [
+                '',
+                "**GitHub Pull Request**: " + pr['html_url'],
+                "**Author**: " + pr['user']['login'],
+                "**State**: " + pr['state'],
+                "**Base Branch**: " + pr['base']['ref'],
+                "**Head Branch**: " + pr['head']['ref'],
+                "**Created**: " + pr['created_at'],
+                '',
+                '**Description**:',
+                pr['body'] or 'No description provided',
+                '',
+                f"**Mergeable**: {pr.get('mergeable', 'Unknown')}",
+                f"**Draft**: {pr.get('draft', False)}",
+                '',
+            ]
+            card_desc = '\n'.join(parts)
+
+            logger.info("Would create WeKan card: %s", card_title)
+            logger.info("In board: %s", board_name)
+
+            return _success_response(
+                action=action,
+                board_name=board_name,
+                card_title=card_title,
+                message=f"PR #{pr['number']} would be synchronized to WeKan"
+            )
+
+        return ORJSONResponse({'status': 'PR event processed', 'action': action})
+
     except Exception as e:
-        logger.error(f"Error handling PR event: {str(e)}")
-        return jsonify({'error': 'Failed to process PR event'}), 500
+        logger.error("Error handling PR event: %s", e)
+        raise WebhookError('PR') from e
 
-def handle_push_event(payload: Dict) -> Any:
+async def handle_push_event(payload: Dict) -> ORJSONResponse:
     """Handle GitHub push events"""
     try:
         ref = payload['ref']
         commits = payload['commits']
         repository = payload['repository']
-        
-        logger.info(f"Processing push event: {len(commits)} commits to {ref}")
-        
+
+        logger.info("Processing push event: %d commits to %s", len(commits), ref)
+
         # Only process pushes to main/master branch
         if ref in ['refs/heads/main', 'refs/heads/master']:
             board_name = f"GitHub Commits - {repository['name']}"
-            
+
             cards_created = 0
-            for commit in commits[:5]:  # Limit to 5 most recent commits
-                commit_message = commit['message'].split('\n')[0]  # First line only
-                card_title = f"Commit: {commit_message}"
-                
-                logger.info(f"Would create WeKan card: {card_title}")
+            info_enabled = logger.isEnabledFor(logging.INFO)
+            # islice caps the iteration without copying the commit list,
+            # and partition grabs the subject line without building a
+            # throwaway list of all lines
+            for commit in islice(commits, MAX_PUSH_COMMITS):
+                commit_message, _, _ = commit['message'].partition('\n')
+                if info_enabled:
+                    logger.info("Would create WeKan card: Commit: %s", commit_message)
                 cards_created += 1
-            
-            logger.info(f"Would create {cards_created} cards in board: {board_name}")
-            
-            return jsonify({
-                'status': 'success',
-                'board_name': board_name,
-                'cards_created': cards_created,
-                'message': f"Processed {len(commits)} commits, would create {cards_created} cards",
-                'mode': 'standalone'
-            })
-        
-        return jsonify({'status': 'Push event processed', 'ref': ref})
-        
+
+            logger.info("Would create %d cards in board: %s", cards_created, board_name)
+
+            return _success_response(
+                board_name=board_name,
+                cards_created=cards_created,
+                message=f"Processed {len(commits)} commits, would create {cards_created} cards"
+            )
+
+        return ORJSONResponse({'status': 'Push event processed', 'ref': ref})
+
     except Exception as e:
-        logger.error(f"Error handling push event: {str(e)}")
-        return jsonify({'error': 'Failed to process push event'}), 500
+        logger.error("Error handling push event: %s", e)
+        raise WebhookError('push') from e
 
-def handle_repository_event(payload: Dict) -> Any:
+async def handle_repository_event(payload: Dict) -> ORJSONResponse:
     """Handle GitHub repository events"""
     try:
         action = payload['action']
         repository = payload['repository']
-        
-        logger.info(f"Processing repository event: {action} for {repository['name']}")
-        
+
+        logger.info("Processing repository event: %s for %s", action, repository['name'])
+
         if action == 'created':
             # Simulate creating a new board for the repository
             board_name = f"Project - {repository['name']}"
-            
-            logger.info(f"Would create WeKan board: {board_name}")
-            
-            return jsonify({
-                'status': 'success',
-                'action': action,
-                'board_name': board_name,
-                'message': f"Would create board for repository {repository['name']}",
-                'mode': 'standalone'
-            })
-        
-        return jsonify({'status': 'Repository event processed', 'action': action})
-        
+
+            logger.info("Would create WeKan board: %s", board_name)
+
+            return _success_response(
+                action=action,
+                board_name=board_name,
+                message=f"Would create board for repository {repository['name']}"
+            )
+
+        return ORJSONResponse({'status': 'Repository event processed', 'action': action})
+
     except Exception as e:
-        logger.error(f"Error handling repository event: {str(e)}")
-        return jsonify({'error': 'Failed to process repository event'}), 500
+        logger.error("Error handling repository event: %s", e)
+        raise WebhookError('repository') from e
 
-@app.errorhandler(404)
-def not_found(error):
-    return jsonify({'error': 'Endpoint not found'}), 404
+# Event dispatch table used by the worker loop; new event types only
+# need a handler registered here
+_HANDLERS = {
+    'issues': handle_issue_event,
+    'pull_request': handle_pull_request_event,
+    'push': handle_push_event,
+    'repository': handle_repository_event,
+    'ping': handle_ping_event,
+}
 
-@app.errorhandler(500)
-def internal_error(error):
-    return jsonify({'error': 'Internal server error'}), 500
+@app.exception_handler(StarletteHTTPException)
+async def http_exception_handler(request: Request, exc: StarletteHTTPException):
+    """Keep the same error response shape as the Flask version"""
+    if exc.status_code == 404:
+        return ORJSONResponse({'error': 'Endpoint not found'}, status_code=404)
+    if exc.status_code == 500:
+        return ORJSONResponse({'error': 'Internal server error'}, status_code=500)
+    return ORJSONResponse({'error': str(exc.detail)}, status_code=exc.status_code)
 
 if __name__ == '__main__':
-    # Start the Flask application
+    # Start the application under uvicorn
     logger.info("Starting GitHub Webhook Receiver (Standalone Mode)...")
-    logger.info(f"Port: {PORT}")
+    logger.info("Port: %d", PORT)
     logger.info("Webhook endpoint: /github-webhook")
     logger.info("Health check endpoint: /health")
     logger.info("Mode: Standalone (no WeKan connection required)")
-    
-    app.run(
-        host='0.0.0.0', 
-        port=PORT,
-        debug=DEBUG
-    )
+
+    if DEBUG:
+        # Single worker keeps the debugger usable in development
+        uvicorn.run(app, host='0.0.0.0', port=PORT, log_level='debug')
+    else:
+        # 2*cores+1 workers saturate the host; uvloop/httptools replace
+        # the stdlib event loop and HTTP parser. An explicit
+        # loop='uvloop' raises when uvloop is missing (it has no
+        # Windows build), so select it only if it imports.
+        try:
+            import uvloop  # noqa: F401
+            loop = 'uvloop'
+        except ImportError:
+            loop = 'auto'
+        workers = int(os.getenv('WEB_CONCURRENCY', 2 * (os.cpu_count() or 1) + 1))
+        uvicorn.run('webhook_receiver_standalone:app', host='0.0.0.0', port=PORT,
+                    workers=workers, loop=loop, http='httptools',
+                    log_level='warning')
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+WSGI Entry Point for the GitHub Webhook Receiver
+================================================
+
+The Flask dev server (app.run) is single-threaded and serializes webhook
+deliveries. Run the receiver under gunicorn with gevent workers instead so
+blocking WeKan HTTP calls yield instead of head-of-line blocking:
+
+    gunicorn -k gevent -w 4 --worker-connections 1000 \
+        -b 0.0.0.0:5000 wsgi:app
+
+Do not use --preload: this module must import in each forked worker so
+every process gets its own background worker threads and its own
+authenticated WeKan session (threads don't survive fork, and a pre-fork
+session would share one socket pool across all workers).
+
+The `app.run` block in webhook_receiver.py remains for local debugging only.
+"""
+
+# gevent must monkey-patch the stdlib before requests/urllib3 are imported
+from gevent import monkey
+monkey.patch_all()
+
+import sys
+import logging
+
+from webhook_receiver import app, initialize_wekan
+
+logger = logging.getLogger(__name__)
+
+if not initialize_wekan():
+    logger.error("Failed to initialize WeKan connection. Exiting.")
+    sys.exit(1)
@@ -1,4 +1,33 @@
+import hashlib
+import os
 import requests
+from cachetools import TTLCache
+
+from wekan_client import WeKanClient, DEFAULT_TIMEOUT
+
+# One authenticated WeKanClient per credential set: the client owns a
+# pooled keep-alive Session and caches its login token, so webhook
+# handlers fanning out WeKan calls skip both the TCP/TLS handshake and
+# the /users/login round-trip on the steady-state path. The key
+# includes a digest of the password so a wrong password never reuses a
+# cached authenticated client and a rotated one re-authenticates
+# immediately instead of after the TTL.
+_clients = TTLCache(maxsize=4, ttl=int(os.getenv('WEKAN_TOKEN_TTL', '300')))
+
+def _get_client(wekan_url: str, username: str, password: str) -> WeKanClient:
+    """Return a cached authenticated client for the given credentials"""
+    key = (wekan_url, username,
+           hashlib.sha256(password.encode('utf-8')).hexdigest())
+    client = _clients.get(key)
+    if client is None:
+        # Drop any client cached for this user under other credentials
+        # so a rotation can't keep the stale session alive
+        for stale in [k for k in _clients if k[:2] == key[:2]]:
+            del _clients[stale]
+        client = WeKanClient(wekan_url, username, password)
+        client.authenticate()
+        _clients[key] = client
+    return client
 
 def create_wekan_board_external(
     wekan_url: str,
@@ -21,36 +50,15 @@ def create_wekan_board_external(
         "error": None
     }
     try:
-        # Authenticate
-        login_url = f"{wekan_url.rstrip('/')}/users/login"
-        login_resp = requests.post(
-            login_url,
-            data=f"username={username}&password={password}",
-            headers={"Content-Type": "application/x-www-form-urlencoded"}
-        )
-        if login_resp.status_code != 200:
-            result["error"] = f"Auth failed: {login_resp.status_code} - {login_resp.text}"
-            return result
-        login_data = login_resp.json()
-        token = login_data.get("token")
-        user_id = login_data.get("id")
-        if not token or not user_id:
-            result["error"] = f"Auth response missing token or id: {login_data}"
+        # Authenticate (client and token cached across calls)
+        try:
+            client = _get_client(wekan_url, username, password)
+        except RuntimeError as e:
+            result["error"] = str(e)
             return result
 
-        # Prepare board creation payload
-        boards_url = f"{wekan_url.rstrip('/')}/api/boards"
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json"
-        }
-        payload = {
-            "title": title,
-            "owner": owner or user_id,
-            "permission": permission,
-            "color": color
-        }
-        resp = requests.post(boards_url, headers=headers, json=payload)
+        resp = client.create_board(title, owner=owner,
+                                   permission=permission, color=color)
         result["response"] = resp.text
         if resp.status_code in [200, 201]:
             data = resp.json()
@@ -58,6 +66,10 @@ def create_wekan_board_external(
             result["board_id"] = data.get("_id")
         else:
             result["error"] = f"Board creation failed: {resp.status_code} - {resp.text}"
+    except requests.Timeout:
+        # Bounded by the client's connect/read timeouts; fail fast
+        # instead of stalling the calling webhook worker
+        result["error"] = f"WeKan request timed out after {DEFAULT_TIMEOUT}s"
     except Exception as e:
         result["error"] = str(e)
     return result
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Async Wekan Board Creation
+==========================
+
+httpx-based async counterpart to the WekanAPIClient in
+wekan_board_manager. Template creation is network-bound: the sync path
+pays one round-trip per list and per card, back to back. Here the
+independent calls are fanned out with asyncio.gather over a single
+pooled AsyncClient, collapsing N serial round-trips into one wave for
+the lists and one wave for all cards.
+
+CLI and other synchronous callers can use create_board_from_template_sync,
+which wraps the coroutine in asyncio.run.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Dict, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncWekanAPIClient:
+    """
+    Async client for the Wekan API. Use as an async context manager so
+    the pooled connections are opened and closed deterministically:
+
+        async with AsyncWekanAPIClient(url, user, password) as client:
+            ...
+    """
+
+    def __init__(self, wekan_url: str, username: str, password: str):
+        self.wekan_url = wekan_url.rstrip('/')
+        self.api_url = f"{self.wekan_url}/api/"
+        self.username = username
+        self.password = password
+        self.user_id = None
+        self._client: Optional[httpx.AsyncClient] = None
+        # get_default_swimlane is identical for every card on a board;
+        # cache it so a K-card template does one swimlane GET, not K
+        self._swimlane_cache: Dict[str, str] = {}
+
+    async def __aenter__(self) -> 'AsyncWekanAPIClient':
+        # http2=True lets the gathered card creations multiplex as
+        # streams over one connection when the server (or its reverse
+        # proxy) speaks HTTP/2; against an HTTP/1.1-only server httpx
+        # negotiates down and the pool limits still apply
+        self._client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=10),
+            timeout=httpx.Timeout(30.0, connect=5.0)
+        )
+        await self._authenticate()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self._client.aclose()
+        self._client = None
+
+    async def _authenticate(self) -> None:
+        response = await self._client.post(
+            f"{self.wekan_url}/users/login",
+            data={'username': self.username, 'password': self.password}
+        )
+        if response.status_code != 200:
+            raise Exception(
+                f"Authentication failed: {response.status_code} - {response.text}")
+        data = response.json()
+        token = data.get('token')
+        self.user_id = data.get('id')
+        if not token or not self.user_id:
+            raise Exception(f"Auth response missing token or id: {data}")
+        self._client.headers['Authorization'] = f"Bearer {token}"
+
+    async def _request(self, method: str, endpoint: str,
+                       data: Optional[Dict] = None) -> Dict:
+        url = self.api_url + endpoint.lstrip('/')
+        response = await self._client.request(method, url, json=data)
+        if response.status_code == 401:
+            # Token expired mid-batch: refresh once and replay
+            await self._authenticate()
+            response = await self._client.request(method, url, json=data)
+        if response.status_code in [200, 201]:
+            try:
+                return response.json()
+            except ValueError:
+                return {"status": "success", "statusCode": response.status_code}
+        raise Exception(
+            f"API request failed: {response.status_code} - {response.text}")
+
+    async def create_board(self, title: str, color: str = "belize",
+                           permission: str = "private") -> Dict:
+        data = {
+            "title": title,
+            "owner": self.user_id,
+            "permission": permission,
+            "color": color
+        }
+        return await self._request('POST', '/boards', data=data)
+
+    async def create_list(self, board_id: str, title: str) -> Dict:
+        return await self._request('POST', f'/boards/{board_id}/lists',
+                                   data={"title": title})
+
+    async def create_card(self, board_id: str, list_id: str, title: str,
+                          description: Optional[str] = None) -> Dict:
+        swimlane_id = await self.get_default_swimlane(board_id)
+        if not swimlane_id:
+            raise Exception("Failed to get swimlane ID. Cannot create card.")
+        data = {
+            "title": title,
+            "description": description or "",
+            "authorId": self.user_id,
+            "swimlaneId": swimlane_id,
+            "members": [],
+            "labelIds": []
+        }
+        return await self._request(
+            'POST', f'/boards/{board_id}/lists/{list_id}/cards', data=data)
+
+    async def get_default_swimlane(self, board_id: str) -> Optional[str]:
+        swimlane_id = self._swimlane_cache.get(board_id)
+        if swimlane_id:
+            return swimlane_id
+        swimlanes = await self._request('GET', f'/boards/{board_id}/swimlanes')
+        if swimlanes:
+            swimlane_id = swimlanes[0].get('_id')
+            if swimlane_id:
+                self._swimlane_cache[board_id] = swimlane_id
+            return swimlane_id
+        return None
+
+
+async def create_board_from_template(wekan_url: str, username: str, password: str,
+                                     template: Dict,
+                                     board_title: Optional[str] = None) -> Dict:
+    """
+    Create a board from a template dict (same shape as the entries in
+    wekan_board_manager.DEFAULT_TEMPLATES), fanning out the independent
+    list and card creations concurrently.
+    """
+    start_time = time.time()
+    title = board_title or template['title']
+
+    async with AsyncWekanAPIClient(wekan_url, username, password) as client:
+        board_data = await client.create_board(title)
+        board_id = board_data.get('_id')
+        if not board_id:
+            raise Exception(f"Failed to create board: {board_data}")
+
+        # One wave for all lists; gather preserves argument order, so
+        # results line up with the template's list order.
+        # return_exceptions matches the card wave and the sync path's
+        # warn-and-skip behavior: one failed list doesn't abort the run
+        # after the board already exists
+        list_items = template['lists']
+        lists_results = await asyncio.gather(
+            *[client.create_list(board_id, li['title']) for li in list_items],
+            return_exceptions=True)
+        lists_data = []
+        list_id_by_name = {}
+        for list_item, list_result in zip(list_items, lists_results):
+            if isinstance(list_result, BaseException):
+                logger.warning("Failed to create list '%s': %s",
+                               list_item['title'], list_result)
+                continue
+            list_id = list_result.get('_id')
+            if not list_id:
+                logger.warning("Failed to create list '%s': %s",
+                               list_item['title'], list_result)
+                continue
+            lists_data.append({'name': list_item['title'], 'id': list_id})
+            list_id_by_name[list_item['title']] = list_id
+
+        # Resolve the swimlane once before the card wave so the gather
+        # below doesn't race N identical swimlane GETs
+        card_specs = []
+        for list_title, cards in template.get('cards', {}).items():
+            list_id = list_id_by_name.get(list_title)
+            if not list_id:
+                logger.warning("Cannot create cards for list '%s': List not found",
+                               list_title)
+                continue
+            card_specs.extend((list_id, card) for card in cards)
+
+        cards_data = []
+        if card_specs:
+            await client.get_default_swimlane(board_id)
+            # return_exceptions keeps one failed card from cancelling
+            # the rest of the wave; failures are logged and skipped
+            card_results = await asyncio.gather(
+                *[client.create_card(board_id, list_id, card['title'],
+                                     description=card.get('description'))
+                  for list_id, card in card_specs],
+                return_exceptions=True)
+            for (list_id, card), card_result in zip(card_specs, card_results):
+                if isinstance(card_result, BaseException):
+                    logger.warning("Failed to create card '%s': %s",
+                                   card['title'], card_result)
+                    continue
+                card_id = card_result.get('_id')
+                if not card_id:
+                    logger.warning("Failed to create card '%s': %s",
+                                   card['title'], card_result)
+                    continue
+                cards_data.append({'title': card['title'], 'id': card_id,
+                                   'list_id': list_id})
+
+    elapsed = time.time() - start_time
+    return {
+        'success': True,
+        'board_id': board_id,
+        'board_url': f"{wekan_url.rstrip('/')}/b/{board_id}",
+        'lists': lists_data,
+        'cards': cards_data,
+        'execution_time': f"{elapsed:.2f}s"
+    }
+
+
+async def create_custom_board(wekan_url: str, username: str, password: str,
+                              board_config: Dict) -> Dict:
+    """
+    Create a board from a custom configuration concurrently. A custom
+    config has the same shape as a template (title/lists/cards), so
+    this shares the template fan-out; concurrency stays bounded by the
+    client's connection limits.
+    """
+    return await create_board_from_template(
+        wekan_url, username, password, board_config)
+
+
+def create_board_from_template_sync(wekan_url: str, username: str, password: str,
+                                    template: Dict,
+                                    board_title: Optional[str] = None) -> Dict:
+    """Synchronous shim for CLI callers without an event loop"""
+    return asyncio.run(create_board_from_template(
+        wekan_url, username, password, template, board_title=board_title))
+
+
+def create_custom_board_sync(wekan_url: str, username: str, password: str,
+                             board_config: Dict) -> Dict:
+    """Synchronous shim for CLI callers without an event loop"""
+    return asyncio.run(create_custom_board(
+        wekan_url, username, password, board_config))
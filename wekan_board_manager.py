@@ -16,14 +16,27 @@ import sys
 import json
 import time
 import logging
-import argparse
+import random
 import requests
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional, Any, Tuple
-from urllib.parse import urljoin
-import subprocess
-import shlex
-from wekan_api_external import create_wekan_board_external
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlencode
+
+# orjson parses raw bytes several times faster than stdlib json; fall
+# back silently where it is not installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
+    def _json_dumps(obj):
+        return json.dumps(obj).encode('utf-8')
 
 # Configure logging
 logging.basicConfig(
@@ -36,6 +49,69 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+
+# Status codes worth retrying; other 4xx responses are permanent and
+# retrying them only hammers the server
+RETRYABLE_STATUS = {408, 429, 500, 502, 503, 504}
+
+# HTTP method constants: call sites pass these so _make_request does no
+# per-call .upper() normalization
+GET = 'GET'
+POST = 'POST'
+PUT = 'PUT'
+DELETE = 'DELETE'
+
+# Slug translation table: one pass over the title instead of a chain of
+# .replace calls each allocating an intermediate string
+_SLUG_TABLE = str.maketrans({' ': '-', '(': '', ')': ''})
+
+
+class WekanAPIError(Exception):
+    """
+    Raised when an API request ultimately fails (after any retries).
+
+    status_code carries the final HTTP status so callers can branch on
+    it instead of parsing the message; it is None for network errors
+    that never produced a response.
+    """
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+def _sleep_backoff(attempt: int, base: float = 1.0, cap: float = 30.0,
+                   jitter: float = 0.5) -> float:
+    """
+    Sleep for a capped exponential backoff with jitter and return the
+    wait time. Jitter desynchronizes parallel clients so their retries
+    don't arrive at the Wekan server as a thundering herd.
+    """
+    wait_time = min(cap, base * (2 ** attempt)) * (1 + random.uniform(0, jitter))
+    time.sleep(wait_time)
+    return wait_time
+
+
+def _build_session() -> requests.Session:
+    """
+    Build a keep-alive Session with a mounted connection pool. A template
+    creation issues one HTTP call per list and card; pooling reuses the
+    TCP/TLS connection across all of them instead of handshaking per call.
+    Retries stay at 0 because _make_request implements its own retry logic.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=0)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+# Module-level session for one-off calls outside the client objects
+# (health checks, prerequisite probes): reuses pooled connections
+# instead of opening a fresh socket per bare requests.get
+_SESSION = _build_session()
+
+
 # Default templates
 DEFAULT_TEMPLATES = {
     "kanban_basic": {
@@ -117,8 +193,13 @@ class WekanAuthManager:
         self.token = None
         self.user_id = None
         self.token_expires = None
+        # Monotonic deadline (with a 5-minute buffer) so checking token
+        # freshness is a single float compare instead of building and
+        # comparing datetimes on every API call
+        self._expiry_monotonic = 0.0
         self.operations_log = []
-        
+        self.session = _build_session()
+
         # Authenticate immediately
         self.authenticate()
     
@@ -135,10 +216,11 @@ class WekanAuthManager:
             start_time = time.time()
             self.operations_log.append(f"Authenticating with Wekan at {login_url}")
             
-            response = requests.post(
+            # Passing a dict lets requests urlencode the body, so
+            # credentials containing '&', '=' or non-ASCII survive
+            response = self.session.post(
                 login_url,
-                data=f"username={self.username}&password={self.password}",
-                headers={"Content-Type": "application/x-www-form-urlencoded"}
+                data={'username': self.username, 'password': self.password}
             )
             
             if response.status_code != 200:
@@ -157,7 +239,14 @@ class WekanAuthManager:
             else:
                 # Default to 90 days if not provided
                 self.token_expires = datetime.now() + timedelta(days=90)
-            
+
+            # Translate the expiry into a monotonic deadline, refreshing
+            # 5 minutes early so a batch never hits a mid-flight 401
+            now = datetime.now(timezone.utc) if self.token_expires.tzinfo \
+                else datetime.now()
+            remaining = (self.token_expires - now).total_seconds()
+            self._expiry_monotonic = time.monotonic() + max(remaining - 300, 60)
+
             elapsed = time.time() - start_time
             self.operations_log.append(f"Authentication successful. Token obtained in {elapsed:.2f}s")
             
@@ -175,14 +264,19 @@ class WekanAuthManager:
         Returns:
             Valid authentication token
         """
-        # Check if token is expired or about to expire (within 5 minutes)
-        now_aware = datetime.now(timezone.utc)
-        if not self.token or not self.token_expires or \
-           now_aware + timedelta(minutes=5) >= self.token_expires:
+        # Check the monotonic deadline (includes the 5-minute buffer)
+        if not self.token or time.monotonic() >= self._expiry_monotonic:
             self.operations_log.append("Token expired or about to expire. Re-authenticating...")
             self.authenticate()
-        
+
         return self.token
+
+    def ensure_fresh(self) -> None:
+        """
+        Refresh the token proactively if it is near expiry. Called before
+        a batch of API calls so the token cannot expire mid-batch.
+        """
+        self.get_valid_token()
     
     def get_operations_log(self) -> List[str]:
         """
@@ -193,117 +287,187 @@ class WekanAuthManager:
         """
         return self.operations_log
 
+    def close(self) -> None:
+        """Close the underlying HTTP session"""
+        self.session.close()
+
 
 class WekanAPIClient:
     """
     Enhanced client for interacting with Wekan API, including retry logic.
     """
     
-    def __init__(self, wekan_url: str, auth_manager: WekanAuthManager):
+    def __init__(self, wekan_url: str, auth_manager: WekanAuthManager,
+                 session: Optional[requests.Session] = None):
         """
         Initialize the API client.
-        
+
         Args:
             wekan_url: Base URL of the Wekan instance
             auth_manager: Authentication manager instance
+            session: Optional requests.Session to reuse keep-alive connections
         """
         self.wekan_url = wekan_url.rstrip('/')
         self.api_url = f"{self.wekan_url}/api/"
+        # api_url is fixed, so endpoint URLs are plain concatenations;
+        # urljoin would re-parse the base URL on every request
+        self._api_prefix = self.api_url
         self.auth_manager = auth_manager
-        self.operations_log = []
-    
+        self.session = session or _build_session()
+        # Bounded so a long session of batch creations cannot grow the
+        # log (and RSS) without limit; per-request tracing goes through
+        # logger.debug instead
+        self.operations_log = deque(maxlen=1000)
+        # Per-board caches: the default swimlane never changes and lists
+        # only change through create_list, so both can be memoized to
+        # avoid an extra GET per created card
+        self._swimlane_cache: Dict[str, str] = {}
+        self._lists_cache: Dict[str, List[Dict]] = {}
+        # Title-keyed view of _lists_cache, built lazily by
+        # get_list_by_name so repeated name lookups are O(1) instead of
+        # a linear scan per call
+        self._lists_by_title: Dict[str, Dict[str, Dict]] = {}
+        # Method dispatch: bound session callables resolved once instead
+        # of an if/elif chain on every request attempt
+        self._verbs = {
+            GET: self.session.get,
+            POST: self.session.post,
+            PUT: self.session.put,
+            DELETE: self.session.delete
+        }
+        # Default header dict rebuilt only when the token changes, not
+        # per request; callers that add headers must copy, not mutate
+        self._default_headers: Dict[str, str] = {}
+        self._headers_token: Optional[str] = None
+        # Whether the server implements the composite bulk endpoint;
+        # None until the first bulk_create probe resolves it
+        self._bulk_supported: Optional[bool] = None
+
     def _get_headers(self) -> Dict[str, str]:
         """
-        Get headers with valid authentication token.
-        
+        Get headers with valid authentication token. The returned dict
+        is shared and cached against the current token; callers must
+        not mutate it.
+
         Returns:
             Dictionary of headers
         """
         token = self.auth_manager.get_valid_token()
-        return {
-            'Authorization': f'Bearer {token}',
-            'Content-Type': 'application/json'
-        }
+        if token != self._headers_token:
+            self._default_headers = {
+                'Authorization': f'Bearer {token}',
+                'Content-Type': 'application/json'
+            }
+            self._headers_token = token
+        return self._default_headers
     
-    def _make_request(self, method: str, endpoint: str, data: Optional[Dict] = None, 
-                     form_data: Optional[Dict] = None, retry_count: int = 3, 
-                     backoff_factor: float = 0.5) -> Dict:
+    def _make_request(self, method: str, endpoint: str, data: Optional[Dict] = None,
+                     form_data: Optional[Dict] = None, retry_count: int = 3) -> Dict:
         """
         Make a request to the Wekan API with retry logic.
-        
+
+        Retries are limited to recoverable failures (RETRYABLE_STATUS and
+        network errors) with capped exponential backoff plus jitter; a
+        Retry-After header on 429/503 takes precedence over the computed
+        wait. Other 4xx responses fail immediately, and a 401 triggers a
+        token refresh without consuming a backoff sleep.
+
         Args:
             method: HTTP method (GET, POST, PUT, DELETE)
             endpoint: API endpoint (without base URL)
             data: JSON data for the request
             form_data: Form data for the request
             retry_count: Number of retries on failure
-            backoff_factor: Backoff factor for retries
-            
+
         Returns:
             Response data as dictionary
         """
-        url = urljoin(self.api_url, endpoint.lstrip('/'))
+        url = self._api_prefix + (endpoint[1:] if endpoint.startswith('/') else endpoint)
         headers = self._get_headers()
-        
-        if form_data:
-            headers['Content-Type'] = 'application/x-www-form-urlencoded'
-        else:
-            headers['Content-Type'] = 'application/json'
-        
-        self.operations_log.append(f"Making {method} request to {url}")
-        
+
+        # Resolve the verb and request body once; every retry attempt
+        # then reuses the same bound callable and kwargs
+        method = method.upper()
+        request_fn = self._verbs.get(method)
+        if request_fn is None:
+            raise ValueError(f"Unsupported HTTP method: {method}")
+
+        # JSON bodies are serialized once with orjson (headers already
+        # carry Content-Type: application/json) instead of letting
+        # requests run stdlib json.dumps per attempt
+        kwargs = {}
+        if method == POST:
+            if form_data:
+                # Copy before overriding Content-Type: headers is the
+                # shared cached dict from _get_headers
+                headers = {**headers, 'Content-Type': 'application/x-www-form-urlencoded'}
+                # urlencode handles escaping ('&', '=', unicode) that
+                # the old manual join silently corrupted
+                kwargs['data'] = urlencode(form_data, doseq=True)
+            elif data is not None:
+                kwargs['data'] = _json_dumps(data)
+        elif method == PUT and data is not None:
+            kwargs['data'] = _json_dumps(data)
+
+        logger.debug("Making %s request to %s", method, url)
+
         for attempt in range(retry_count + 1):
             try:
-                if attempt > 0:
-                    wait_time = backoff_factor * (2 ** (attempt - 1))
-                    self.operations_log.append(f"Retry attempt {attempt} after {wait_time:.2f}s")
-                    time.sleep(wait_time)
-                
-                if method.upper() == 'GET':
-                    response = requests.get(url, headers=headers)
-                elif method.upper() == 'POST':
-                    if form_data:
-                        # Convert dict to form data string
-                        form_data_str = '&'.join([f"{k}={v}" for k, v in form_data.items()])
-                        response = requests.post(url, headers=headers, data=form_data_str)
-                    else:
-                        response = requests.post(url, headers=headers, json=data)
-                elif method.upper() == 'PUT':
-                    response = requests.put(url, headers=headers, json=data)
-                elif method.upper() == 'DELETE':
-                    response = requests.delete(url, headers=headers)
-                else:
-                    raise ValueError(f"Unsupported HTTP method: {method}")
-                
+                response = request_fn(url, headers=headers, **kwargs)
+
                 # Check for authentication errors
                 if response.status_code == 401:
                     self.operations_log.append("Authentication error. Refreshing token...")
                     self.auth_manager.authenticate()
                     headers = self._get_headers()
+                    if method == POST and form_data:
+                        headers = {**headers, 'Content-Type': 'application/x-www-form-urlencoded'}
                     continue
-                
+
                 # Check for success
                 if response.status_code in [200, 201]:
                     try:
-                        return response.json()
+                        return _json_loads(response.content)
                     except ValueError:
                         return {"status": "success", "statusCode": response.status_code}
-                
+
                 # Handle other errors
                 error_msg = f"API request failed: {response.status_code} - {response.text}"
                 self.operations_log.append(f"ERROR: {error_msg}")
-                
+
+                # Permanent client errors never succeed on retry
+                if response.status_code not in RETRYABLE_STATUS:
+                    raise WekanAPIError(error_msg, status_code=response.status_code)
+
                 # If we've exhausted retries, raise the exception
                 if attempt == retry_count:
-                    raise Exception(error_msg)
-                
+                    raise WekanAPIError(error_msg, status_code=response.status_code)
+
+                # The server knows best how long it needs on 429/503
+                retry_after = 0.0
+                if response.status_code in (429, 503):
+                    try:
+                        retry_after = float(response.headers.get('Retry-After', 0))
+                    except ValueError:
+                        retry_after = 0.0
+                if retry_after > 0:
+                    logger.debug("Retry attempt %d after Retry-After %.2fs",
+                                 attempt + 1, retry_after)
+                    time.sleep(retry_after)
+                else:
+                    wait_time = _sleep_backoff(attempt)
+                    logger.debug("Retry attempt %d after %.2fs", attempt + 1, wait_time)
+
             except requests.RequestException as e:
                 error_msg = f"Request error: {str(e)}"
                 self.operations_log.append(f"ERROR: {error_msg}")
-                
+
                 # If we've exhausted retries, raise the exception
                 if attempt == retry_count:
-                    raise Exception(error_msg)
+                    raise WekanAPIError(error_msg)
+
+                wait_time = _sleep_backoff(attempt)
+                logger.debug("Retry attempt %d after %.2fs", attempt + 1, wait_time)
     
     def create_board(self, title: str, owner: Optional[str] = None, color: str = "belize",
                     permission: str = "private") -> Dict:
@@ -313,7 +477,7 @@ class WekanAPIClient:
         self.operations_log.append(f"Creating board: {title}")
         
         # Generate a slug from the title
-        slug = title.lower().replace(" ", "-").replace("(", "").replace(")", "")
+        slug = title.lower().translate(_SLUG_TABLE)
         
         data = {
             "title": title,
@@ -325,22 +489,20 @@ class WekanAPIClient:
         
         # Direct implementation without using _make_request
         boards_url = f"{self.wekan_url}/api/boards/"
-        headers = {
-            "Authorization": f"Bearer {self.auth_manager.get_valid_token()}",
-            "Content-Type": "application/json"
-        }
+        headers = self._get_headers()
         
-        self.operations_log.append(f"Request URL: {boards_url}")
-        self.operations_log.append(f"Request data: {data}")
+        logger.debug("Request URL: %s", boards_url)
+        logger.debug("Request data: %s", data)
         
         try:
-            response = requests.post(boards_url, headers=headers, json=data)
-            
-            self.operations_log.append(f"POST /api/boards Status: {response.status_code}")
-            
+            response = self.session.post(boards_url, headers=headers,
+                                         data=_json_dumps(data))
+
+            logger.debug("POST /api/boards Status: %s", response.status_code)
+
             if response.status_code in [200, 201]:
                 try:
-                    board_data = response.json()
+                    board_data = _json_loads(response.content)
                     board_id = board_data.get('_id')
                     self.operations_log.append(f"Board created successfully: {board_id}")
                     return board_data
@@ -370,9 +532,12 @@ class WekanAPIClient:
             List data including ID
         """
         data = {"title": title}
-        
-        self.operations_log.append(f"Creating list '{title}' in board {board_id}")
-        return self._make_request('POST', f'/boards/{board_id}/lists', data=data)
+
+        logger.debug("Creating list '%s' in board %s", title, board_id)
+        result = self._make_request(POST, f'/boards/{board_id}/lists', data=data)
+        # The cached list collection for this board is now stale
+        self.invalidate_lists(board_id)
+        return result
     
     def create_card(self, board_id: str, list_id: str, title: str,
                    description: Optional[str] = None,
@@ -410,9 +575,59 @@ class WekanAPIClient:
             "labelIds": label_ids or []
         }
         
-        self.operations_log.append(f"Creating card '{title}' in list {list_id}")
-        return self._make_request('POST', f'/boards/{board_id}/lists/{list_id}/cards', data=data)
-    
+        logger.debug("Creating card '%s' in list %s", title, list_id)
+        return self._make_request(POST, f'/boards/{board_id}/lists/{list_id}/cards', data=data)
+
+    def bulk_create(self, board_id: str, lists: List[Dict],
+                    cards: List[Dict]) -> Optional[Dict]:
+        """
+        Create a board's lists and cards in one composite request.
+
+        Servers with the bulk endpoint accept the whole structure in a
+        single round-trip instead of one call per list and card.
+        Servers (or proxies) without it answer the unknown route with
+        404/405/400/501; that is treated as feature detection, cached
+        on the client so later boards skip the probe entirely, and None
+        is returned so the caller can fall back to the per-item path.
+        Any other failure also returns None — the bulk call is an
+        optimization and must never make creation fail where the
+        per-item path would have succeeded.
+
+        Args:
+            board_id: Board ID
+            lists: List payloads ({"title": ...})
+            cards: Card payloads ({"listTitle": ..., "title": ...,
+                "description": ...})
+
+        Returns:
+            Parsed response with created lists and cards, or None if
+            the bulk path is unavailable
+        """
+        if self._bulk_supported is False:
+            return None
+
+        payload = {"lists": lists, "cards": cards}
+
+        logger.debug("Bulk-creating %d lists and %d cards in board %s",
+                     len(lists), len(cards), board_id)
+        try:
+            # retry_count=0: a transient failure here should hand over
+            # to the per-item path, not burn backoff sleeps first
+            result = self._make_request(POST, f'/boards/{board_id}/bulk',
+                                        data=payload, retry_count=0)
+        except WekanAPIError as e:
+            if e.status_code in (400, 404, 405, 501):
+                logger.debug("Bulk endpoint not available (%s); using per-item creation",
+                             e.status_code)
+                self._bulk_supported = False
+            else:
+                logger.debug("Bulk creation failed (%s); falling back to per-item creation", e)
+            return None
+        self._bulk_supported = True
+        self.invalidate_lists(board_id)
+        return result
+
+
     def get_lists(self, board_id: str) -> List[Dict]:
         """
         Get all lists for a board.
@@ -423,15 +638,30 @@ class WekanAPIClient:
         Returns:
             List of list dictionaries
         """
-        self.operations_log.append(f"Getting lists for board {board_id}")
+        cached = self._lists_cache.get(board_id)
+        if cached is not None:
+            return cached
+
+        logger.debug("Getting lists for board %s", board_id)
         try:
-            result = self._make_request('GET', f'/boards/{board_id}/lists')
-            self.operations_log.append(f"DEBUG: get_lists result type: {type(result)}")
-            self.operations_log.append(f"DEBUG: get_lists result: {result}")
+            result = self._make_request(GET, f'/boards/{board_id}/lists')
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("get_lists result: %r", result)
+            self._lists_cache[board_id] = result
             return result
         except Exception as e:
             self.operations_log.append(f"ERROR in get_lists: {str(e)}")
             return []
+
+    def invalidate_lists(self, board_id: str) -> None:
+        """
+        Drop the cached lists for a board (called after a mutation).
+
+        Args:
+            board_id: Board ID
+        """
+        self._lists_cache.pop(board_id, None)
+        self._lists_by_title.pop(board_id, None)
     
     def get_list_by_name(self, board_id: str, list_name: str) -> Optional[Dict]:
         """
@@ -444,19 +674,28 @@ class WekanAPIClient:
         Returns:
             List dictionary or None if not found
         """
-        self.operations_log.append(f"Looking for list '{list_name}' in board {board_id}")
+        logger.debug("Looking for list '%s' in board %s", list_name, board_id)
         try:
-            lists = self.get_lists(board_id)
-            
-            # Check if lists is a list or dict
-            if isinstance(lists, list):
-                for list_item in lists:
-                    if isinstance(list_item, dict) and list_item.get('title') == list_name:
-                        self.operations_log.append(f"Found list '{list_name}' with ID {list_item.get('_id')}")
-                        return list_item
-            else:
-                self.operations_log.append(f"WARNING: get_lists returned non-list: {type(lists)}")
-            
+            by_title = self._lists_by_title.get(board_id)
+            if by_title is None:
+                lists = self.get_lists(board_id)
+
+                # Check if lists is a list or dict
+                if not isinstance(lists, list):
+                    self.operations_log.append(f"WARNING: get_lists returned non-list: {type(lists)}")
+                    return None
+
+                # Index once per board; subsequent lookups are dict hits.
+                # invalidate_lists drops this alongside _lists_cache.
+                by_title = {item['title']: item for item in lists
+                            if isinstance(item, dict) and 'title' in item}
+                self._lists_by_title[board_id] = by_title
+
+            list_item = by_title.get(list_name)
+            if list_item is not None:
+                logger.debug("Found list '%s' with ID %s", list_name, list_item.get('_id'))
+                return list_item
+
             self.operations_log.append(f"WARNING: List '{list_name}' not found in board {board_id}")
             return None
         except Exception as e:
@@ -473,8 +712,8 @@ class WekanAPIClient:
         Returns:
             List of swimlane dictionaries
         """
-        self.operations_log.append(f"Getting swimlanes for board {board_id}")
-        return self._make_request('GET', f'/boards/{board_id}/swimlanes')
+        logger.debug("Getting swimlanes for board %s", board_id)
+        return self._make_request(GET, f'/boards/{board_id}/swimlanes')
 
     def move_card(self, board_id: str, card_id: str, new_list_id: str) -> Dict:
         """
@@ -495,7 +734,7 @@ class WekanAPIClient:
             "listId": new_list_id,
             "authorId": self.auth_manager.user_id 
         }
-        return self._make_request('PUT', f'/boards/{board_id}/lists/{new_list_id}/cards/{card_id}', data=data)
+        return self._make_request(PUT, f'/boards/{board_id}/lists/{new_list_id}/cards/{card_id}', data=data)
 
     def add_comment_to_card(self, board_id: str, card_id: str, comment_text: str) -> Dict:
         """
@@ -514,7 +753,7 @@ class WekanAPIClient:
             "comment": comment_text,
             "authorId": self.auth_manager.user_id
         }
-        return self._make_request('POST', f'/boards/{board_id}/cards/{card_id}/comments', data=data)
+        return self._make_request(POST, f'/boards/{board_id}/cards/{card_id}/comments', data=data)
 
     def get_default_swimlane(self, board_id: str) -> Optional[str]:
         """
@@ -526,9 +765,16 @@ class WekanAPIClient:
         Returns:
             Default swimlane ID or None
         """
+        swimlane_id = self._swimlane_cache.get(board_id)
+        if swimlane_id:
+            return swimlane_id
+
         swimlanes = self.get_swimlanes(board_id)
         if swimlanes and len(swimlanes) > 0:
-            return swimlanes[0].get('_id')
+            swimlane_id = swimlanes[0].get('_id')
+            if swimlane_id:
+                self._swimlane_cache[board_id] = swimlane_id
+            return swimlane_id
         return None
     
     def get_operations_log(self) -> List[str]:
@@ -538,7 +784,11 @@ class WekanAPIClient:
         Returns:
             List of operation log entries
         """
-        return self.operations_log
+        return list(self.operations_log)
+
+    def close(self) -> None:
+        """Close the underlying HTTP session"""
+        self.session.close()
 
 
 class BoardTemplateManager:
@@ -555,10 +805,63 @@ class BoardTemplateManager:
         """
         self.templates = DEFAULT_TEMPLATES.copy()
         self.operations_log = []
-        
+
+        # Validate and canonicalize every template once at load time so
+        # the board-creation hot path resolves cards by list index with
+        # no per-card name lookups or structure checks
+        self._compiled = {}
+        for name, template in self.templates.items():
+            if self.validate_template(template):
+                self._compiled[name] = self._compile_template(template)
+            else:
+                self.operations_log.append(f"ERROR: Built-in template '{name}' failed validation")
+
         # Load custom templates if directory provided
         if templates_dir:
             self._load_custom_templates(templates_dir)
+
+    @staticmethod
+    def _compile_template(template: Dict) -> Dict:
+        """
+        Canonicalize a validated template: list titles as a tuple, and
+        cards grouped by the ordinal index of their list so the create
+        path pairs them with the created list IDs positionally.
+
+        Args:
+            template: Validated template data
+
+        Returns:
+            Compiled template dictionary
+        """
+        list_titles = tuple(list_item['title'] for list_item in template['lists'])
+        index_by_title = {title: i for i, title in enumerate(list_titles)}
+        cards_by_index = [() for _ in list_titles]
+        for list_title, cards in template.get('cards', {}).items():
+            cards_by_index[index_by_title[list_title]] = tuple(cards)
+        return {
+            'title': template['title'],
+            'list_titles': list_titles,
+            'cards_by_index': tuple(cards_by_index)
+        }
+
+    def get_compiled(self, template_name: str) -> Dict:
+        """
+        Get the compiled (canonicalized) form of a template.
+
+        Args:
+            template_name: Name of the template
+
+        Returns:
+            Compiled template dictionary
+        """
+        if template_name not in self._compiled:
+            available = ", ".join(self._compiled.keys())
+            error_msg = f"Template '{template_name}' not found. Available templates: {available}"
+            self.operations_log.append(f"ERROR: {error_msg}")
+            raise ValueError(error_msg)
+
+        self.operations_log.append(f"Using template: {template_name}")
+        return self._compiled[template_name]
     
     def _load_custom_templates(self, templates_dir: str) -> None:
         """
@@ -573,21 +876,26 @@ class BoardTemplateManager:
         
         self.operations_log.append(f"Loading custom templates from {templates_dir}")
         
-        for filename in os.listdir(templates_dir):
-            if filename.endswith('.json'):
-                template_name = os.path.splitext(filename)[0]
-                filepath = os.path.join(templates_dir, filename)
-                
+        # scandir hands back DirEntry objects with the file type cached,
+        # so no extra stat per candidate; orjson parses the raw bytes
+        with os.scandir(templates_dir) as entries:
+            for entry in entries:
+                if not entry.is_file() or not entry.name.endswith('.json'):
+                    continue
+
+                template_name = entry.name[:-5]
+
                 try:
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        template = json.load(f)
-                    
+                    with open(entry.path, 'rb') as f:
+                        template = _json_loads(f.read())
+
                     if self.validate_template(template):
                         self.templates[template_name] = template
+                        self._compiled[template_name] = self._compile_template(template)
                         self.operations_log.append(f"Loaded template: {template_name}")
-                    
+
                 except Exception as e:
-                    self.operations_log.append(f"ERROR: Failed to load template {filepath}: {str(e)}")
+                    self.operations_log.append(f"ERROR: Failed to load template {entry.path}: {str(e)}")
     
     def get_template(self, template_name: str) -> Dict:
         """
@@ -648,10 +956,13 @@ class BoardTemplateManager:
                 self.operations_log.append("ERROR: Template 'cards' field must be an object")
                 return False
             
-            # Check that each card list exists and has valid cards
+            # Check that each card list exists and has valid cards; the
+            # set makes each existence check O(1) instead of rescanning
+            # the lists array per entry
+            list_titles = {list_item['title'] for list_item in template['lists']
+                           if 'title' in list_item}
             for list_title, cards in template['cards'].items():
-                list_exists = any(list_item['title'] == list_title for list_item in template['lists'])
-                if not list_exists:
+                if list_title not in list_titles:
                     self.operations_log.append(f"ERROR: Cards specified for non-existent list '{list_title}'")
                     return False
                 
@@ -691,16 +1002,24 @@ class BoardCreator:
         """
         self.api_client = api_client
         self.template_manager = template_manager
-        self.operations_log = []
+        # Bounded so a huge board cannot grow the retained log without
+        # limit; get_operations_log snapshots it as a list
+        self.operations_log = deque(maxlen=10000)
+        # Board/card URLs share this prefix; build it once instead of
+        # re-deriving the base URL in every creation method
+        self._board_prefix = f"{api_client.wekan_url}/b/"
     
-    def create_board_from_template(self, template_name: str, board_title: Optional[str] = None, 
-                                  **kwargs) -> Dict:
+    def create_board_from_template(self, template_name: str, board_title: Optional[str] = None,
+                                  collect_ids: bool = True, **kwargs) -> Dict:
         """
         Create a board based on a template.
         
         Args:
             template_name: Name of the template to use
             board_title: Override the template title (optional)
+            collect_ids: Build the returned lists/cards ID dicts; pass
+                False on fire-and-forget paths to skip the per-item
+                allocations
             **kwargs: Additional parameters for board creation
             
         Returns:
@@ -708,12 +1027,15 @@ class BoardCreator:
         """
         start_time = time.time()
         self.operations_log.append(f"Creating board from template: {template_name}")
-        
-        # Get the template
-        template = self.template_manager.get_template(template_name)
-        
+
+        # Refresh the token up front so it cannot expire mid-batch
+        self.api_client.auth_manager.ensure_fresh()
+
+        # Get the compiled template (validated and canonicalized at load)
+        compiled = self.template_manager.get_compiled(template_name)
+
         # Use provided title or template title
-        title = board_title or template['title']
+        title = board_title or compiled['title']
         
         # Create the board
         board_data = self.api_client.create_board(title, **kwargs)
@@ -726,78 +1048,119 @@ class BoardCreator:
         
         self.operations_log.append(f"Board created successfully: {board_id}")
         
-        # Create lists
+        # List creations are independent of each other, and card
+        # creations are independent once the list IDs exist, so both
+        # waves run on a bounded thread pool: requests releases the GIL
+        # during socket I/O, and the cap keeps concurrency within what
+        # the Wekan server (and the retry logic) tolerates
         lists_data = []
-        for list_item in template['lists']:
-            list_data = self.api_client.create_list(board_id, list_item['title'])
-            list_id = list_data.get('_id')
-            
-            if not list_id:
-                self.operations_log.append(f"WARNING: Failed to create list '{list_item['title']}': {list_data}")
-                continue
-            
-            lists_data.append({
-                'name': list_item['title'],
-                'id': list_id
-            })
-            
-            self.operations_log.append(f"List created: {list_item['title']} ({list_id})")
-        
-        # Create cards
+        list_ids = []
         cards_data = []
-        if 'cards' in template:
-            for list_title, cards in template['cards'].items():
-                # Find the list ID
-                list_id = next((item['id'] for item in lists_data if item['name'] == list_title), None)
-                
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            # Submit in template order and collect in the same order so
+            # the output is deterministic; the board's list ordering
+            # still depends on which parallel POST lands first
+            list_futures = [
+                (list_title, executor.submit(self.api_client.create_list,
+                                             board_id, list_title))
+                for list_title in compiled['list_titles']
+            ]
+            for list_title, future in list_futures:
+                try:
+                    list_data = future.result()
+                    list_id = list_data.get('_id')
+                except Exception as e:
+                    list_data, list_id = str(e), None
+
+                # Keep list_ids aligned with the template's list order so
+                # cards_by_index pairs positionally below
+                list_ids.append(list_id)
+
                 if not list_id:
-                    self.operations_log.append(f"WARNING: Cannot create cards for list '{list_title}': List not found")
+                    self.operations_log.append(f"WARNING: Failed to create list '{list_title}': {list_data}")
                     continue
-                
-                for card in cards:
-                    card_data = self.api_client.create_card(
-                        board_id, 
-                        list_id, 
-                        card['title'], 
-                        description=card.get('description')
-                    )
-                    
-                    card_id = card_data.get('_id')
-                    
+
+                if collect_ids:
+                    lists_data.append({
+                        'name': list_title,
+                        'id': list_id
+                    })
+
+                if logger.isEnabledFor(logging.INFO):
+                    self.operations_log.append("List created: %s (%s)" % (list_title, list_id))
+
+            # Flatten cards to (list_id, card) pairs before submitting;
+            # the compiled template already grouped them by list index
+            card_specs = []
+            for index, cards in enumerate(compiled['cards_by_index']):
+                if not cards:
+                    continue
+
+                list_id = list_ids[index]
+                if not list_id:
+                    self.operations_log.append(
+                        f"WARNING: Cannot create cards for list '{compiled['list_titles'][index]}': List not found")
+                    continue
+
+                card_specs.extend((list_id, card) for card in cards)
+
+            if card_specs:
+                # Resolve the swimlane once so the parallel card calls
+                # don't race duplicate swimlane GETs
+                self.api_client.get_default_swimlane(board_id)
+
+                card_futures = [
+                    (list_id, card,
+                     executor.submit(self.api_client.create_card, board_id,
+                                     list_id, card['title'],
+                                     description=card.get('description')))
+                    for list_id, card in card_specs
+                ]
+                for list_id, card, future in card_futures:
+                    try:
+                        card_data = future.result()
+                        card_id = card_data.get('_id')
+                    except Exception as e:
+                        card_data, card_id = str(e), None
+
                     if not card_id:
                         self.operations_log.append(f"WARNING: Failed to create card '{card['title']}': {card_data}")
                         continue
-                    
-                    cards_data.append({
-                        'title': card['title'],
-                        'id': card_id,
-                        'list_id': list_id
-                    })
-                    
-                    self.operations_log.append(f"Card created: {card['title']} ({card_id})")
-        
-        elapsed = time.time() - start_time
-        self.operations_log.append(f"Board creation completed in {elapsed:.2f}s")
-        
-        # Construct the board URL
-        wekan_url = self.api_client.wekan_url
-        board_url = f"{wekan_url}/b/{board_id}"
-        
+
+                    if collect_ids:
+                        cards_data.append({
+                            'title': card['title'],
+                            'id': card_id,
+                            'list_id': list_id
+                        })
+
+                    if logger.isEnabledFor(logging.INFO):
+                        self.operations_log.append("Card created: %s (%s)" % (card['title'], card_id))
+
+        # Format the elapsed time once; it feeds both the log entry and
+        # the returned execution_time
+        elapsed_str = f"{time.time() - start_time:.2f}s"
+        self.operations_log.append(f"Board creation completed in {elapsed_str}")
+
         return {
             'success': True,
             'board_id': board_id,
-            'board_url': board_url,
+            'board_url': self._board_prefix + board_id,
             'lists': lists_data,
             'cards': cards_data,
-            'execution_time': f"{elapsed:.2f}s"
+            'execution_time': elapsed_str
         }
     
-    def create_custom_board(self, board_config: Dict) -> Dict:
+    def create_custom_board(self, board_config: Dict,
+                            collect_ids: bool = True) -> Dict:
         """
         Create a board based on custom configuration.
         
         Args:
             board_config: Custom board configuration
+            collect_ids: Build the returned lists/cards ID dicts; pass
+                False on fire-and-forget paths to skip the per-item
+                allocations
             
         Returns:
             Dictionary with board, lists, and cards data
@@ -822,71 +1185,127 @@ class BoardCreator:
             raise Exception(error_msg)
         
         self.operations_log.append(f"Board created successfully: {board_id}")
-        
-        # Create lists
-        lists_data = []
-        for list_item in board_config['lists']:
-            list_data = self.api_client.create_list(board_id, list_item['title'])
-            list_id = list_data.get('_id')
-            
-            if not list_id:
-                self.operations_log.append(f"WARNING: Failed to create list '{list_item['title']}': {list_data}")
-                continue
-            
-            lists_data.append({
-                'name': list_item['title'],
-                'id': list_id
-            })
-            
-            self.operations_log.append(f"List created: {list_item['title']} ({list_id})")
-        
-        # Create cards
-        cards_data = []
-        if 'cards' in board_config:
-            for list_title, cards in board_config['cards'].items():
-                # Find the list ID
-                list_id = next((item['id'] for item in lists_data if item['name'] == list_title), None)
-                
-                if not list_id:
-                    self.operations_log.append(f"WARNING: Cannot create cards for list '{list_title}': List not found")
-                    continue
-                
-                for card in cards:
-                    card_data = self.api_client.create_card(
-                        board_id, 
-                        list_id, 
-                        card['title'], 
-                        description=card.get('description')
-                    )
-                    
-                    card_id = card_data.get('_id')
-                    
-                    if not card_id:
-                        self.operations_log.append(f"WARNING: Failed to create card '{card['title']}': {card_data}")
+
+        # Try the composite endpoint first: one round-trip for the whole
+        # structure. bulk_create returns None on servers without it and
+        # the per-item path below takes over.
+        bulk_cards = [
+            {'listTitle': list_title, 'title': card['title'],
+             'description': card.get('description', '')}
+            for list_title, cards in board_config.get('cards', {}).items()
+            for card in cards
+        ]
+        bulk_result = self.api_client.bulk_create(
+            board_id, board_config['lists'], bulk_cards)
+
+        if bulk_result is not None:
+            created_lists = bulk_result.get('lists', [])
+            created_cards = bulk_result.get('cards', [])
+            lists_data, cards_data = [], []
+            if collect_ids:
+                lists_data = [{'name': item.get('title'), 'id': item.get('_id')}
+                              for item in created_lists]
+                cards_data = [{'title': item.get('title'), 'id': item.get('_id'),
+                               'list_id': item.get('listId')}
+                              for item in created_cards]
+            self.operations_log.append(
+                f"Bulk-created {len(created_lists)} lists and {len(created_cards)} cards")
+        else:
+            # Per-item fallback mirrors create_board_from_template: both
+            # waves run on a bounded thread pool since list creations are
+            # independent and card creations only need the list IDs.
+            # list_id_by_name is needed for card creation regardless;
+            # lists_data is only the caller-facing view.
+            lists_data = []
+            list_id_by_name = {}
+            cards_data = []
+            with ThreadPoolExecutor(max_workers=10) as executor:
+                # Submit in config order and collect in the same order so
+                # the output is deterministic; the board's list ordering
+                # still depends on which parallel POST lands first
+                list_futures = [
+                    (list_item['title'],
+                     executor.submit(self.api_client.create_list,
+                                     board_id, list_item['title']))
+                    for list_item in board_config['lists']
+                ]
+                for list_title, future in list_futures:
+                    try:
+                        list_data = future.result()
+                        list_id = list_data.get('_id')
+                    except Exception as e:
+                        list_data, list_id = str(e), None
+
+                    if not list_id:
+                        self.operations_log.append(f"WARNING: Failed to create list '{list_title}': {list_data}")
                         continue
-                    
-                    cards_data.append({
-                        'title': card['title'],
-                        'id': card_id,
-                        'list_id': list_id
-                    })
-                    
-                    self.operations_log.append(f"Card created: {card['title']} ({card_id})")
-        
-        elapsed = time.time() - start_time
-        self.operations_log.append(f"Board creation completed in {elapsed:.2f}s")
-        
-        # Construct the board URL
-        wekan_url = self.api_client.wekan_url
-        board_url = f"{wekan_url}/b/{board_id}"
-        
+
+                    list_id_by_name[list_title] = list_id
+                    if collect_ids:
+                        lists_data.append({
+                            'name': list_title,
+                            'id': list_id
+                        })
+
+                    if logger.isEnabledFor(logging.INFO):
+                        self.operations_log.append("List created: %s (%s)" % (list_title, list_id))
+
+                # Flatten cards to (list_id, card) pairs before submitting
+                card_specs = []
+                for list_title, cards in board_config.get('cards', {}).items():
+                    list_id = list_id_by_name.get(list_title)
+
+                    if not list_id:
+                        self.operations_log.append(f"WARNING: Cannot create cards for list '{list_title}': List not found")
+                        continue
+
+                    card_specs.extend((list_id, card) for card in cards)
+
+                if card_specs:
+                    # Resolve the swimlane once so the parallel card calls
+                    # don't race duplicate swimlane GETs
+                    self.api_client.get_default_swimlane(board_id)
+
+                    card_futures = [
+                        (list_id, card,
+                         executor.submit(self.api_client.create_card, board_id,
+                                         list_id, card['title'],
+                                         description=card.get('description')))
+                        for list_id, card in card_specs
+                    ]
+                    for list_id, card, future in card_futures:
+                        try:
+                            card_data = future.result()
+                            card_id = card_data.get('_id')
+                        except Exception as e:
+                            card_data, card_id = str(e), None
+
+                        if not card_id:
+                            self.operations_log.append(f"WARNING: Failed to create card '{card['title']}': {card_data}")
+                            continue
+
+                        if collect_ids:
+                            cards_data.append({
+                                'title': card['title'],
+                                'id': card_id,
+                                'list_id': list_id
+                            })
+
+                        if logger.isEnabledFor(logging.INFO):
+                            self.operations_log.append("Card created: %s (%s)" % (card['title'], card_id))
+
+        # Format the elapsed time once; it feeds both the log entry and
+        # the returned execution_time
+        elapsed_str = f"{time.time() - start_time:.2f}s"
+        self.operations_log.append(f"Board creation completed in {elapsed_str}")
+
         return {
             'success': True,
             'board_id': board_id,
-            'board_url': board_url,
+            'board_url': self._board_prefix + board_id,
             'lists': lists_data,
             'cards': cards_data,
-            'execution_time': f"{elapsed:.2f}s"
+            'execution_time': elapsed_str
         }
     
     def add_card_to_board(self, board_id: str, list_name: str, card_title: str, 
@@ -933,12 +1352,11 @@ class BoardCreator:
         
         self.operations_log.append(f"Card created successfully: {card_id}")
         
-        elapsed = time.time() - start_time
-        self.operations_log.append(f"Card creation completed in {elapsed:.2f}s")
-        
+        elapsed_str = f"{time.time() - start_time:.2f}s"
+        self.operations_log.append(f"Card creation completed in {elapsed_str}")
+
         # Construct the card URL
-        wekan_url = self.api_client.wekan_url
-        card_url = f"{wekan_url}/b/{board_id}/cards/{card_id}"
+        card_url = f"{self._board_prefix}{board_id}/cards/{card_id}"
         
         return {
             'success': True,
@@ -949,7 +1367,7 @@ class BoardCreator:
             'list_id': list_id,
             'title': card_title,
             'description': card_description,
-            'execution_time': f"{elapsed:.2f}s"
+            'execution_time': elapsed_str
         }
     
     def get_operations_log(self) -> List[str]:
@@ -959,7 +1377,7 @@ class BoardCreator:
         Returns:
             List of operation log entries
         """
-        return self.operations_log
+        return list(self.operations_log)
 
 
 class OutputFormatter:
@@ -991,11 +1409,11 @@ class OutputFormatter:
             Structured output dictionary
         """
         elapsed = time.time() - self.start_time
-        
+
         output = {
             "success": success,
             "execution_time": f"{elapsed:.2f}s",
-            "operations_log": operations_log or []
+            "operations_log": self._condense_log(operations_log or [])
         }
         
         if success:
@@ -1003,9 +1421,44 @@ class OutputFormatter:
             output["board_url"] = board_url
             output["lists"] = lists or []
             output["cards"] = cards or []
-        
+
         return output
 
+    @staticmethod
+    def _condense_log(log: List[str]) -> List[str]:
+        """
+        Collapse consecutive duplicate entries and cap the log length so
+        a large board run cannot balloon the JSON output to multi-MB.
+
+        Args:
+            log: Raw operation log entries
+
+        Returns:
+            Condensed log, at most ~2000 entries
+        """
+        # One pass: repeated identical lines become "line (×N)"
+        condensed = []
+        previous = None
+        count = 0
+        for line in log:
+            if line == previous:
+                count += 1
+                continue
+            if count > 1:
+                condensed[-1] = f"{previous} (×{count})"
+            condensed.append(line)
+            previous = line
+            count = 1
+        if count > 1:
+            condensed[-1] = f"{previous} (×{count})"
+
+        if len(condensed) > 2000:
+            elided = len(condensed) - 2000
+            condensed = (condensed[:1000]
+                         + [f"... ({elided} entries elided) ..."]
+                         + condensed[-1000:])
+        return condensed
+
 
 def load_config(config_path: str = 'wekan_config.json') -> Dict:
     """
@@ -1021,8 +1474,10 @@ def load_config(config_path: str = 'wekan_config.json') -> Dict:
     if not os.path.exists(config_path):
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
     
-    with open(config_path, 'r') as f:
-        return json.load(f)
+    # Read raw bytes and let the module's JSON helper (orjson when
+    # installed) parse them; stdlib json is the fallback
+    with open(config_path, 'rb') as f:
+        return _json_loads(f.read())
 
 def validate_prerequisites(config: Dict) -> bool:
     """
@@ -1039,29 +1494,45 @@ def validate_prerequisites(config: Dict) -> bool:
         logger.error("Wekan credentials not found in configuration file.")
         return False
     
-    # Check connectivity to Wekan
+    # Check connectivity to Wekan. HEAD is enough to prove the server
+    # is up without downloading the landing page body; redirects and
+    # auth challenges still mean the server is reachable.
     wekan_url = config.get('wekan_url', 'http://localhost:8088')
     try:
-        response = requests.get(wekan_url)
-        if response.status_code != 200:
+        response = _SESSION.head(wekan_url, timeout=(3, 3), allow_redirects=True)
+        if response.status_code not in (200, 301, 302, 401):
             logger.error(f"Cannot connect to Wekan at {wekan_url}: {response.status_code}")
             return False
+    except requests.Timeout:
+        logger.error(f"Connection to Wekan at {wekan_url} timed out")
+        return False
     except requests.RequestException as e:
         logger.error(f"Cannot connect to Wekan at {wekan_url}: {str(e)}")
         return False
-    
+
     return True
 
 
-def main():
+# Parser built on first use and reused afterwards: the ~20
+# add_argument calls run once even when main() is invoked repeatedly
+# in-process, and library consumers still never pay the argparse import
+_PARSER = None
+
+
+def _build_parser():
     """
-    Main entry point for the script.
+    Build the CLI argument parser.
     """
+    # Imported here so library consumers of this module don't pay the
+    # argparse import at startup
+    import argparse
+
     parser = argparse.ArgumentParser(description='Create Wekan boards automatically')
     parser.add_argument('--template', help='Template to use (kanban_basic, scrum, devops, nicedev_agent)')
     parser.add_argument('--title', help='Board title')
     parser.add_argument('--config', help='Path to custom configuration file')
     parser.add_argument('--output', help='Path to output file (default: stdout)')
+    parser.add_argument('--compact', action='store_true', help='Emit minified JSON output')
     parser.add_argument('--url', help='Wekan URL (default: http://localhost:8088)')
     parser.add_argument('--username', help='Wekan username (default: from WEKAN_USERNAME env var)')
     parser.add_argument('--password', help='Wekan password (default: from WEKAN_PASSWORD env var)')
@@ -1088,9 +1559,19 @@ def main():
     # Arguments for adding a comment
     parser.add_argument('--add-comment', action='store_true', help='Add a comment to a card')
     parser.add_argument('--comment-text', help='The text for the comment')
-    
 
-    args = parser.parse_args()
+    return parser
+
+
+def main():
+    """
+    Main entry point for the script.
+    """
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = _build_parser()
+
+    args = _PARSER.parse_args()
     if args.verbose:
         logger.setLevel(logging.DEBUG)
         logger.debug("Verbose mode enabled")
@@ -1129,8 +1610,8 @@ def main():
                 logger.info(f"Cards to create per list: {tpl.get('cards', {})}")
             elif args.config:
                 try:
-                    with open(args.config, 'r', encoding='utf-8') as f:
-                        cfg = json.load(f)
+                    with open(args.config, 'rb') as f:
+                        cfg = _json_loads(f.read())
                     logger.info(f"Would create custom board '{cfg.get('title')}'")
                     logger.info(f"Lists to create: {[lst['title'] for lst in cfg.get('lists', [])]}")
                     logger.info(f"Cards to create per list: {cfg.get('cards', {})}")
@@ -1157,7 +1638,7 @@ def main():
                 success=False,
                 operations_log=["ERROR: Prerequisites not met"]
             )
-            _output_result(output, args.output)
+            _output_result(output, args.output, compact=args.compact)
             return 1
         
         # Set up the authentication manager
@@ -1173,163 +1654,113 @@ def main():
         # Set up the board creator
         board_creator = BoardCreator(api_client, template_manager)
         
-        # Collect all operation logs
-        all_logs = []
-        all_logs.extend(auth_manager.get_operations_log())
-        all_logs.extend(api_client.get_operations_log())
-        all_logs.extend(template_manager.get_operations_log())
-        all_logs.extend(board_creator.get_operations_log())
-        
-        # Create board from template, custom configuration, or add card to existing board
-        if args.move_card:
-            if not all([args.board_id, args.card_id, args.new_list_name]):
-                logger.error("Moving a card requires --board-id, --card-id, and --new-list-name")
-                output = output_formatter.format_output(success=False, operations_log=all_logs + ["ERROR: Missing arguments for moving card."])
-            else:
-                try:
-                    dest_list = api_client.get_list_by_name(args.board_id, args.new_list_name)
-                    if not dest_list:
-                        raise ValueError(f"Destination list '{args.new_list_name}' not found.")
-                    result = api_client.move_card(args.board_id, args.card_id, dest_list['_id'])
-                    all_logs.extend(api_client.get_operations_log())
-                    output = output_formatter.format_output(success=True, operations_log=all_logs)
-                except Exception as e:
-                    logger.error(f"Error moving card: {str(e)}")
-                    output = output_formatter.format_output(success=False, operations_log=all_logs + [f"ERROR: {str(e)}"])
-        
-        elif args.add_comment:
-            if not all([args.board_id, args.card_id, args.comment_text]):
-                logger.error("Adding a comment requires --board-id, --card-id, and --comment-text")
-                output = output_formatter.format_output(success=False, operations_log=all_logs + ["ERROR: Missing arguments for adding comment."])
-            else:
-                try:
-                    result = api_client.add_comment_to_card(args.board_id, args.card_id, args.comment_text)
-                    all_logs.extend(api_client.get_operations_log())
-                    output = output_formatter.format_output(success=True, operations_log=all_logs)
-                except Exception as e:
-                    logger.error(f"Error adding comment: {str(e)}")
-                    output = output_formatter.format_output(success=False, operations_log=all_logs + [f"ERROR: {str(e)}"])
-
-        elif args.add_card:
-            # Add card to existing board
-            if not args.board_id:
-                logger.error("Board ID is required when adding a card")
-                output = output_formatter.format_output(
-                    success=False,
-                    operations_log=all_logs + ["ERROR: Board ID is required when adding a card. Use --board-id."]
-                )
-            elif not args.list_name:
-                logger.error("List name is required when adding a card")
-                output = output_formatter.format_output(
-                    success=False,
-                    operations_log=all_logs + ["ERROR: List name is required when adding a card. Use --list-name."]
-                )
-            elif not args.card_title:
-                logger.error("Card title is required when adding a card")
-                output = output_formatter.format_output(
-                    success=False,
-                    operations_log=all_logs + ["ERROR: Card title is required when adding a card. Use --card-title."]
-                )
+        # Operation logs are gathered once, after the action has run,
+        # so each component's log is copied a single time instead of
+        # being re-extended and re-concatenated along the way
+        def _collect_logs() -> List[str]:
+            logs = []
+            logs.extend(auth_manager.get_operations_log())
+            logs.extend(template_manager.get_operations_log())
+            logs.extend(api_client.get_operations_log())
+            logs.extend(board_creator.get_operations_log())
+            return logs
+
+
+        # Handlers for each CLI action; the dispatch loop below owns
+        # argument validation and error-output construction so none of
+        # it is copy-pasted per action
+        def _board_output(result):
+            return output_formatter.format_output(
+                success=True,
+                board_id=result['board_id'],
+                board_url=result['board_url'],
+                lists=result['lists'],
+                cards=result['cards'],
+                operations_log=_collect_logs()
+            )
+
+        def _do_move():
+            dest_list = api_client.get_list_by_name(args.board_id, args.new_list_name)
+            if not dest_list:
+                raise ValueError(f"Destination list '{args.new_list_name}' not found.")
+            api_client.move_card(args.board_id, args.card_id, dest_list['_id'])
+            return output_formatter.format_output(success=True, operations_log=_collect_logs())
+
+        def _do_comment():
+            api_client.add_comment_to_card(args.board_id, args.card_id, args.comment_text)
+            return output_formatter.format_output(success=True, operations_log=_collect_logs())
+
+        def _do_add_card():
+            result = board_creator.add_card_to_board(
+                board_id=args.board_id,
+                list_name=args.list_name,
+                card_title=args.card_title,
+                card_description=args.card_description
+            )
+            return output_formatter.format_output(
+                success=True,
+                board_id=result['board_id'],
+                board_url=result.get('board_url'),
+                cards=[{
+                    'title': result['title'],
+                    'id': result['card_id'],
+                    'list_id': result['list_id']
+                }],
+                operations_log=_collect_logs()
+            )
+
+        def _do_config():
+            with open(args.config, 'rb') as f:
+                board_config = _json_loads(f.read())
+            return _board_output(board_creator.create_custom_board(board_config))
+
+        def _do_template():
+            return _board_output(board_creator.create_board_from_template(
+                template_name=args.template,
+                board_title=args.title
+            ))
+
+        # (flag, required args, log label, handler) — evaluated in
+        # order; the first action whose flag is set wins
+        _ACTIONS = (
+            ('move_card', ('board_id', 'card_id', 'new_list_name'), 'moving card', _do_move),
+            ('add_comment', ('board_id', 'card_id', 'comment_text'), 'adding comment', _do_comment),
+            ('add_card', ('board_id', 'list_name', 'card_title'), 'adding card', _do_add_card),
+            ('config', (), 'creating board from configuration', _do_config),
+            ('template', (), 'creating board from template', _do_template),
+        )
+
+        output = None
+        for flag, required, label, handler in _ACTIONS:
+            if not getattr(args, flag):
+                continue
+            missing = [name for name in required if not getattr(args, name)]
+            if missing:
+                options = ', '.join('--' + name.replace('_', '-') for name in missing)
+                logger.error(f"Missing arguments for {label}: {options}")
+                all_logs = _collect_logs()
+                all_logs.append(f"ERROR: Missing arguments for {label}: {options}")
+                output = output_formatter.format_output(success=False, operations_log=all_logs)
             else:
                 try:
-                    # Add card to board
-                    result = board_creator.add_card_to_board(
-                        board_id=args.board_id,
-                        list_name=args.list_name,
-                        card_title=args.card_title,
-                        card_description=args.card_description
-                    )
-                    
-                    # Add logs from card creation
-                    all_logs.extend(board_creator.get_operations_log())
-                    
-                    # Format output
-                    output = output_formatter.format_output(
-                        success=True,
-                        board_id=result['board_id'],
-                        board_url=result.get('board_url'),
-                        cards=[{
-                            'title': result['title'],
-                            'id': result['card_id'],
-                            'list_id': result['list_id']
-                        }],
-                        operations_log=all_logs
-                    )
-                    
+                    output = handler()
                 except Exception as e:
-                    logger.error(f"Error adding card to board: {str(e)}")
-                    output = output_formatter.format_output(
-                        success=False,
-                        operations_log=all_logs + [f"ERROR: {str(e)}"]
-                    )
-        
-        elif args.config:
-            # Load custom configuration
-            try:
-                with open(args.config, 'r', encoding='utf-8') as f:
-                    board_config = json.load(f)
-                
-                # Create board from custom configuration
-                result = board_creator.create_custom_board(board_config)
-                
-                # Add logs from board creation
-                all_logs.extend(board_creator.get_operations_log())
-                
-                # Format output
-                output = output_formatter.format_output(
-                    success=True,
-                    board_id=result['board_id'],
-                    board_url=result['board_url'],
-                    lists=result['lists'],
-                    cards=result['cards'],
-                    operations_log=all_logs
-                )
-                
-            except Exception as e:
-                logger.error(f"Error creating board from configuration: {str(e)}")
-                output = output_formatter.format_output(
-                    success=False,
-                    operations_log=all_logs + [f"ERROR: {str(e)}"]
-                )
-        
-        elif args.template:
-            # Create board from template
-            try:
-                result = board_creator.create_board_from_template(
-                    template_name=args.template,
-                    board_title=args.title
-                )
-                
-                # Add logs from board creation
-                all_logs.extend(board_creator.get_operations_log())
-                
-                # Format output
-                output = output_formatter.format_output(
-                    success=True,
-                    board_id=result['board_id'],
-                    board_url=result['board_url'],
-                    lists=result['lists'],
-                    cards=result['cards'],
-                    operations_log=all_logs
-                )
-                
-            except Exception as e:
-                logger.error(f"Error creating board from template: {str(e)}")
-                output = output_formatter.format_output(
-                    success=False,
-                    operations_log=all_logs + [f"ERROR: {str(e)}"]
-                )
-        
-        else:
+                    logger.error(f"Error {label}: {str(e)}")
+                    all_logs = _collect_logs()
+                    all_logs.append(f"ERROR: {str(e)}")
+                    output = output_formatter.format_output(success=False, operations_log=all_logs)
+            break
+
+        if output is None:
             # No template, configuration, or add-card specified
             logger.error("No action specified")
             output = output_formatter.format_output(
                 success=False,
-                operations_log=all_logs + ["ERROR: No action specified. Use --template, --config, or --add-card."]
+                operations_log=_collect_logs() + ["ERROR: No action specified. Use --template, --config, or --add-card."]
             )
-        
+
         # Output the result
-        _output_result(output, args.output)
+        _output_result(output, args.output, compact=args.compact)
         
     except Exception as e:
         logger.error(f"Unhandled error: {str(e)}")
@@ -1337,30 +1768,65 @@ def main():
             success=False,
             operations_log=[f"ERROR: {str(e)}"]
         )
-        _output_result(output, args.output)
+        _output_result(output, args.output, compact=args.compact)
         return 1
     
     return 0
 
 
-def _output_result(output: Dict, output_file: Optional[str] = None) -> None:
+def _output_result(output: Dict, output_file: Optional[str] = None,
+                   compact: bool = False) -> None:
     """
     Output the result to a file or stdout.
-    
+
+    The encoder streams its chunks straight to the target instead of
+    building the whole document as one intermediate string first, which
+    matters when the operations log makes the output large. With
+    compact=True the separators drop all whitespace for machine
+    consumers.
+
     Args:
         output: Output data
         output_file: Path to output file (optional)
+        compact: Emit minified JSON instead of indented
     """
+    if orjson is not None:
+        # orjson serializes to UTF-8 bytes in one C pass; write them
+        # through the binary layer to skip the str round-trip
+        payload = orjson.dumps(output, option=0 if compact else orjson.OPT_INDENT_2)
+        if output_file:
+            try:
+                with open(output_file, 'wb') as f:
+                    f.write(payload)
+                logger.info(f"Output written to {output_file}")
+                return
+            except Exception as e:
+                logger.error(f"Error writing output to {output_file}: {str(e)}")
+        sys.stdout.buffer.write(payload + b'\n')
+        sys.stdout.buffer.flush()
+        return
+
+    if compact:
+        encoder = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False)
+    else:
+        encoder = json.JSONEncoder(indent=2, ensure_ascii=False)
+
+    def _write(fh, trailing_newline):
+        for chunk in encoder.iterencode(output):
+            fh.write(chunk)
+        if trailing_newline:
+            fh.write('\n')
+
     if output_file:
         try:
             with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(output, f, indent=2, ensure_ascii=False)
+                _write(f, trailing_newline=False)
             logger.info(f"Output written to {output_file}")
         except Exception as e:
             logger.error(f"Error writing output to {output_file}: {str(e)}")
-            print(json.dumps(output, indent=2, ensure_ascii=False))
+            _write(sys.stdout, trailing_newline=True)
     else:
-        print(json.dumps(output, indent=2, ensure_ascii=False))
+        _write(sys.stdout, trailing_newline=True)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Shared WeKan HTTP client for the API test scripts and external helpers.
+
+Consolidates the authenticate() + requests blocks that were duplicated
+across test_wekan_api.py, test_wekan_integration.py and
+wekan_api_external.py into one keep-alive client: a single pooled
+Session carries every call, the login token is cached with a TTL, and
+the Authorization header lives on the Session so callers never rebuild
+it per request.
+"""
+
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Connect/read timeouts applied to every outbound call
+DEFAULT_TIMEOUT = (3.05, 10)
+
+
+class WeKanClient:
+    """Authenticated WeKan API client backed by a pooled keep-alive Session"""
+
+    # WeKan tokens live much longer than this; re-login every 10 minutes
+    # is cheap insurance against expiry mid-run
+    TOKEN_TTL = 600
+
+    def __init__(self, wekan_url, username, password, session=None):
+        self.wekan_url = wekan_url.rstrip('/')
+        self.username = username
+        self.password = password
+        self.user_id = None
+        self._token = None
+        self._token_expiry = 0.0
+
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=8,
+                pool_maxsize=32,
+                max_retries=Retry(total=3, backoff_factor=0.2,
+                                  status_forcelist=[502, 503, 504])
+            )
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+        self._session = session
+
+    def authenticate(self):
+        """
+        Log in and cache the token; returns (token, user_id).
+
+        Raises RuntimeError if authentication fails.
+        """
+        # Passing a dict lets requests urlencode the body (and set the
+        # form Content-Type) instead of a hand-built f-string that breaks
+        # on '&', '=' or non-ASCII credentials
+        response = self._session.post(
+            f"{self.wekan_url}/users/login",
+            data={'username': self.username, 'password': self.password},
+            timeout=DEFAULT_TIMEOUT
+        )
+        if response.status_code != 200:
+            raise RuntimeError(
+                f"Authentication failed: {response.status_code} - {response.text}")
+
+        data = response.json()
+        token = data.get('token')
+        user_id = data.get('id')
+        if not token or not user_id:
+            raise RuntimeError(f"Auth response missing token or id: {data}")
+
+        self._token = token
+        self.user_id = user_id
+        self._token_expiry = time.time() + self.TOKEN_TTL
+        self._session.headers['Authorization'] = f"Bearer {token}"
+        return token, user_id
+
+    def get_session(self):
+        """Return the shared Session, authenticating (or re-authenticating) lazily"""
+        if self._token is None or time.time() >= self._token_expiry:
+            self.authenticate()
+        return self._session
+
+    def get_boards(self):
+        """GET /api/boards; returns the requests.Response"""
+        session = self.get_session()
+        return session.get(f"{self.wekan_url}/api/boards", timeout=DEFAULT_TIMEOUT)
+
+    def create_board(self, title, owner=None, permission="private",
+                     color="belize", slug=None):
+        """POST /api/boards with a JSON payload; returns the requests.Response"""
+        session = self.get_session()
+        payload = {
+            'title': title,
+            'owner': owner or self.user_id,
+            'permission': permission,
+            'color': color
+        }
+        if slug:
+            payload['slug'] = slug
+        return session.post(f"{self.wekan_url}/api/boards",
+                            json=payload, timeout=DEFAULT_TIMEOUT)